@@ -39,6 +39,7 @@ Install:
 import json
 import os
 import sys
+import textwrap
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -127,18 +128,48 @@ def add_to_history(prompt: str, response: str) -> None:
         console.print(f"[yellow]Warning: Could not save to history: {e}[/yellow]")
 
 
-def get_client(verbose: bool = False) -> Optional[ClaudeClient]:
+def build_generate_kwargs(
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None,
+    system: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build keyword overrides for ClaudeClient.generate, skipping unset values.
+
+    Args:
+        max_tokens: Maximum tokens to generate
+        temperature: Sampling temperature
+        system: System prompt
+
+    Returns:
+        Dictionary of generation overrides
+    """
+    kwargs: Dict[str, Any] = {}
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    if system is not None:
+        kwargs["system"] = system
+    return kwargs
+
+
+def get_client(
+    verbose: bool = False, config: Optional[Dict[str, Any]] = None
+) -> Optional[ClaudeClient]:
     """
     Initialize Claude client with error handling.
 
     Args:
         verbose: Enable verbose output
+        config: Already-loaded configuration (loaded from disk if omitted)
 
     Returns:
         ClaudeClient instance or None if initialization fails
     """
     try:
-        config = load_config()
+        if config is None:
+            config = load_config()
         client = ClaudeClient(
             model=config.get("default_model", "claude-sonnet-4-5-20250929"),
             temperature=config.get("default_temperature", 0.7),
@@ -210,23 +241,18 @@ def ask(
         console.print("[red]Error: Prompt required (use argument or --file)[/red]")
         sys.exit(1)
 
+    # Load config once for client and defaults
+    config = load_config()
+
     # Initialize client
-    client = get_client(verbose=verbose)
+    client = get_client(verbose=verbose, config=config)
     if not client:
         sys.exit(1)
 
-    # Load config for defaults
-    config = load_config()
     output_format = format or config.get("output_format", "text")
 
     # Build kwargs
-    kwargs = {}
-    if max_tokens is not None:
-        kwargs["max_tokens"] = max_tokens
-    if temperature is not None:
-        kwargs["temperature"] = temperature
-    if system is not None:
-        kwargs["system"] = system
+    kwargs = build_generate_kwargs(max_tokens, temperature, system)
 
     # Show progress while generating
     try:
@@ -500,10 +526,17 @@ def batch(input_file: str, output_file: str, verbose: bool) -> None:
     Input file should have one prompt per line.
     Output will be JSON with all responses.
     """
-    client = get_client(verbose=verbose)
+    config = load_config()
+    client = get_client(verbose=verbose, config=config)
     if not client:
         sys.exit(1)
 
+    # Resolve generation defaults once rather than per prompt
+    gen_kwargs = build_generate_kwargs(
+        max_tokens=config.get("default_max_tokens"),
+        temperature=config.get("default_temperature"),
+    )
+
     try:
         # Read prompts
         with open(input_file) as f:
@@ -511,39 +544,36 @@ def batch(input_file: str, output_file: str, verbose: bool) -> None:
 
         console.print(f"[cyan]Processing {len(prompts)} prompts...[/cyan]")
 
-        results = []
+        succeeded = 0
 
-        with Progress(console=console) as progress:
+        # Write each result as soon as it is ready, in the layout json.dump(indent=2)
+        # would give the whole list, so responses are not all held in memory
+        with Progress(console=console) as progress, open(output_file, "w") as out:
             task = progress.add_task("Processing...", total=len(prompts))
 
+            out.write("[")
             for i, prompt in enumerate(prompts, 1):
                 try:
-                    response = client.generate(prompt)
-                    results.append(
-                        {
-                            "prompt": prompt,
-                            "response": response,
-                            "success": True,
-                            "index": i,
-                        }
-                    )
+                    response = client.generate(prompt, **gen_kwargs)
+                    result = {
+                        "prompt": prompt,
+                        "response": response,
+                        "success": True,
+                        "index": i,
+                    }
+                    succeeded += 1
                 except Exception as e:
-                    results.append(
-                        {"prompt": prompt, "error": str(e), "success": False, "index": i}
-                    )
+                    result = {"prompt": prompt, "error": str(e), "success": False, "index": i}
 
+                out.write(",\n" if i > 1 else "\n")
+                out.write(textwrap.indent(json.dumps(result, indent=2), "  "))
                 progress.update(task, advance=1)
-
-        # Save results
-        with open(output_file, "w") as f:
-            json.dump(results, f, indent=2)
+            out.write("\n]" if prompts else "]")
 
         console.print(f"[green]Results saved to {output_file}[/green]")
-        console.print(f"[cyan]Processed: {len(results)} prompts[/cyan]")
-        console.print(
-            f"[green]Successful: {sum(1 for r in results if r['success'])}[/green]"
-        )
-        console.print(f"[red]Failed: {sum(1 for r in results if not r['success'])}[/red]")
+        console.print(f"[cyan]Processed: {len(prompts)} prompts[/cyan]")
+        console.print(f"[green]Successful: {succeeded}[/green]")
+        console.print(f"[red]Failed: {len(prompts) - succeeded}[/red]")
 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -24,14 +24,29 @@ Then visit:
 import asyncio
 import logging
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from functools import partial
+from typing import Any, AsyncGenerator, Deque, Dict, Optional
+
+import orjson
+from cachetools import TTLCache, cached
+from fastapi import (
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
-from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel, Field, field_validator
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from claude_oauth_auth import ClaudeClient, get_auth_status
 
@@ -43,10 +58,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Pydantic models for request/response validation
+# Pydantic models for request validation. Response models document the API
+# shape in OpenAPI only; handlers return ORJSONResponse directly.
 class GenerateRequest(BaseModel):
     """Request model for text generation."""
 
+    # Strip in pydantic-core before min_length, so whitespace-only prompts are rejected
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     prompt: str = Field(..., min_length=1, max_length=10000, description="The prompt to send to Claude")
     max_tokens: Optional[int] = Field(
         None, ge=1, le=8000, description="Maximum tokens to generate"
@@ -56,13 +75,9 @@ class GenerateRequest(BaseModel):
     )
     system: Optional[str] = Field(None, description="Optional system prompt")
 
-    @field_validator("prompt")
-    @classmethod
-    def validate_prompt(cls, v: str) -> str:
-        """Ensure prompt is not just whitespace."""
-        if not v.strip():
-            raise ValueError("Prompt cannot be empty or whitespace only")
-        return v.strip()
+
+# Optional GenerateRequest fields forwarded to ClaudeClient.generate
+GENERATE_OPTIONS = {"max_tokens", "temperature", "system"}
 
 
 class GenerateResponse(BaseModel):
@@ -111,9 +126,73 @@ class ChatResponse(BaseModel):
     timestamp: str
 
 
+# Pre-encoded Server-Sent Events framing for /api/stream
+SSE_DATA_PREFIX = b"data: "
+SSE_SEPARATOR = b"\n\n"
+SSE_DONE = b"data: [DONE]\n\n"
+
+# WebSocket limits: max concurrent connections and idle timeout (seconds)
+MAX_WEBSOCKETS = int(os.environ.get("MAX_WS", 1000))
+WS_IDLE_TIMEOUT = 60.0
+ws_semaphore: Optional[asyncio.Semaphore] = None
+
 # Global client instance (initialized in lifespan)
 claude_client: Optional[ClaudeClient] = None
 
+# Dedicated thread pool for blocking Claude calls (initialized in lifespan),
+# sized to the concurrency the upstream API can sustain
+CLAUDE_POOL_SIZE = int(os.environ.get("CLAUDE_POOL", 16))
+claude_executor: Optional[ThreadPoolExecutor] = None
+
+# Cached ISO 8601 timestamp, refreshed by a timer on the event loop (see lifespan)
+TIMESTAMP_REFRESH_INTERVAL = 0.1  # seconds
+CURRENT_ISO_TS: str = datetime.utcnow().isoformat()
+_timestamp_timer: Optional[asyncio.TimerHandle] = None
+
+
+# Per-session chat history: last CHAT_HISTORY_LENGTH messages per session,
+# idle sessions expire after CHAT_SESSION_TTL seconds
+CHAT_HISTORY_LENGTH = 10
+CHAT_SESSION_TTL = 3600
+chat_sessions: "TTLCache[str, Deque[Dict[str, str]]]" = TTLCache(
+    maxsize=10_000, ttl=CHAT_SESSION_TTL
+)
+
+
+def get_chat_history(session_id: str) -> Deque[Dict[str, str]]:
+    """Return the bounded history for a chat session, creating it if needed."""
+    history = chat_sessions.get(session_id)
+    if history is None:
+        history = deque(maxlen=CHAT_HISTORY_LENGTH)
+    # Re-insert on every access so active sessions do not expire
+    chat_sessions[session_id] = history
+    return history
+
+
+async def run_claude(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking Claude call on the dedicated executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(claude_executor, partial(func, *args, **kwargs))
+
+
+# Auth state changes on the order of minutes; share one result across requests
+AUTH_STATUS_TTL = 30  # seconds
+
+
+@cached(TTLCache(maxsize=1, ttl=AUTH_STATUS_TTL), lock=threading.Lock())
+def cached_auth_status() -> Dict[str, Any]:
+    """Return get_auth_status(), cached for AUTH_STATUS_TTL seconds."""
+    return get_auth_status()
+
+
+def _refresh_timestamp() -> None:
+    """Refresh CURRENT_ISO_TS and reschedule itself on the running loop."""
+    global CURRENT_ISO_TS, _timestamp_timer
+    CURRENT_ISO_TS = datetime.utcnow().isoformat()
+    _timestamp_timer = asyncio.get_running_loop().call_later(
+        TIMESTAMP_REFRESH_INTERVAL, _refresh_timestamp
+    )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -122,21 +201,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     This initializes the Claude client on startup and cleans up on shutdown.
     """
-    global claude_client
+    global claude_client, claude_executor, ws_semaphore
 
     # Startup
     logger.info("Starting FastAPI application...")
+    _refresh_timestamp()
+    claude_executor = ThreadPoolExecutor(
+        max_workers=CLAUDE_POOL_SIZE, thread_name_prefix="claude"
+    )
+    ws_semaphore = asyncio.Semaphore(MAX_WEBSOCKETS)
     try:
         claude_client = ClaudeClient(verbose=True)
         logger.info("Claude client initialized successfully")
     except ValueError as e:
-        logger.error(f"Failed to initialize Claude client: {e}")
+        logger.error("Failed to initialize Claude client: %s", e)
         claude_client = None
 
     yield
 
     # Shutdown
     logger.info("Shutting down FastAPI application...")
+    if _timestamp_timer is not None:
+        _timestamp_timer.cancel()
+    if claude_executor is not None:
+        claude_executor.shutdown(wait=False)
+        claude_executor = None
     claude_client = None
 
 
@@ -147,17 +236,79 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
+class StaticCORSMiddleware:
+    """
+    Wildcard CORS with mostly pre-built headers.
+
+    Behaves like CORSMiddleware(allow_origins=["*"], allow_methods=["*"],
+    allow_headers=["*"], allow_credentials=True) without its per-request
+    option matching. Preflight requests get a 204 that echoes the requested
+    method and headers (browsers don't let a literal "*" cover Authorization,
+    or anything on a credentialed request). Other responses get a static
+    header set, echoing the Origin instead of "*" when the request carries
+    cookies.
+    In production, use CORSMiddleware with an explicit list of allowed origins.
+    """
+
+    RESPONSE_HEADERS = [
+        (b"access-control-allow-origin", b"*"),
+        (b"access-control-allow-credentials", b"true"),
+    ]
+    PREFLIGHT_HEADERS = [
+        (b"access-control-allow-credentials", b"true"),
+        (b"access-control-max-age", b"600"),
+        (b"vary", b"Origin"),
+    ]
+    PREFLIGHT_BODY: Message = {"type": "http.response.body", "body": b""}
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope["headers"])
+        origin = request_headers.get(b"origin")
+        requested_method = request_headers.get(b"access-control-request-method")
+
+        if scope["method"] == "OPTIONS" and requested_method is not None:
+            headers = [
+                (b"access-control-allow-origin", origin or b"*"),
+                (b"access-control-allow-methods", requested_method),
+            ] + self.PREFLIGHT_HEADERS
+            requested_headers = request_headers.get(b"access-control-request-headers")
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send(self.PREFLIGHT_BODY)
+            return
+
+        cors_headers = self.RESPONSE_HEADERS
+        if origin is not None and b"cookie" in request_headers:
+            # Credentialed responses must name the origin, not "*"
+            cors_headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(StaticCORSMiddleware)
 
 
 # Dependency injection for Claude client
@@ -176,6 +327,32 @@ def get_claude_client() -> ClaudeClient:
     return claude_client
 
 
+# Fixed-shape GenerateResponse body; only the string fields need JSON escaping
+GENERATE_RESPONSE_TEMPLATE = (
+    b'{"success":true,"response":%s,"prompt":%s,"model":%s,'
+    b'"timestamp":%s,"tokens_used":%d}'
+)
+
+
+def encode_generate_response(
+    response: str, prompt: str, model: str, timestamp: str, tokens_used: int
+) -> bytes:
+    """Encode a successful GenerateResponse body by splicing escaped fields into a template."""
+    dumps = orjson.dumps
+    return GENERATE_RESPONSE_TEMPLATE % (
+        dumps(response),
+        dumps(prompt),
+        dumps(model),
+        dumps(timestamp),
+        tokens_used,
+    )
+
+
+async def send_json_fast(websocket: WebSocket, payload: Dict[str, Any]) -> None:
+    """Send a JSON payload serialized once by orjson as a binary (UTF-8) frame."""
+    await websocket.send_bytes(orjson.dumps(payload))
+
+
 # Routes
 @app.get("/", tags=["General"])
 async def root() -> Dict[str, Any]:
@@ -197,58 +374,76 @@ async def root() -> Dict[str, Any]:
     }
 
 
-@app.get("/health", response_model=HealthResponse, tags=["Monitoring"])
-async def health_check() -> Dict[str, Any]:
+@app.get(
+    "/health",
+    response_model=None,
+    responses={200: {"model": HealthResponse}},
+    tags=["Monitoring"],
+)
+def health_check() -> ORJSONResponse:
     """
     Health check endpoint for monitoring and load balancers.
 
     Returns:
         Health status including Claude client state
     """
+    # Responses are built from trusted data, so serialize directly without models
     if claude_client is None:
-        return {
-            "status": "unhealthy",
-            "claude_client": "not initialized",
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        return ORJSONResponse(
+            {
+                "status": "unhealthy",
+                "claude_client": "not initialized",
+                "auth_type": None,
+                "model": None,
+                "timestamp": CURRENT_ISO_TS,
+            }
+        )
 
     try:
         auth_info = claude_client.get_auth_info()
-        return {
-            "status": "healthy",
-            "claude_client": "initialized",
-            "auth_type": auth_info["auth_type"],
-            "model": auth_info["model"],
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        return ORJSONResponse(
+            {
+                "status": "healthy",
+                "claude_client": "initialized",
+                "auth_type": auth_info["auth_type"],
+                "model": auth_info["model"],
+                "timestamp": CURRENT_ISO_TS,
+            }
+        )
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {
-            "status": "unhealthy",
-            "claude_client": "error",
-            "error": str(e),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        logger.error("Health check failed: %s", e)
+        return ORJSONResponse(
+            {
+                "status": "unhealthy",
+                "claude_client": "error",
+                "auth_type": None,
+                "model": None,
+                "timestamp": CURRENT_ISO_TS,
+            }
+        )
 
 
 @app.get("/auth-status", tags=["Monitoring"])
-async def auth_status() -> Dict[str, Any]:
+def auth_status() -> Dict[str, Any]:
     """
     Get comprehensive authentication status.
 
+    Declared with plain ``def`` so the blocking credential discovery
+    (environment, files) runs in the threadpool instead of the event loop.
+
     Returns:
         Detailed authentication information
     """
     try:
-        status = get_auth_status()
+        status = cached_auth_status()
         return {
             "success": True,
             "status": status,
             "client_initialized": claude_client is not None,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": CURRENT_ISO_TS,
         }
     except Exception as e:
-        logger.error(f"Error getting auth status: {e}")
+        logger.error("Error getting auth status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         )
@@ -265,7 +460,7 @@ async def auth_status() -> Dict[str, Any]:
 )
 async def generate(
     request: GenerateRequest, client: ClaudeClient = Depends(get_claude_client)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Generate text using Claude API.
 
@@ -283,88 +478,85 @@ async def generate(
     """
     try:
         # Build kwargs for optional parameters
-        kwargs = {}
-        if request.max_tokens is not None:
-            kwargs["max_tokens"] = request.max_tokens
-        if request.temperature is not None:
-            kwargs["temperature"] = request.temperature
-        if request.system is not None:
-            kwargs["system"] = request.system
+        kwargs = request.model_dump(include=GENERATE_OPTIONS, exclude_none=True)
 
         # Generate response (run in thread pool to avoid blocking)
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, lambda: client.generate(request.prompt, **kwargs)
+        response = await run_claude(client.generate, request.prompt, **kwargs)
+
+        return Response(
+            content=encode_generate_response(
+                response,
+                request.prompt,
+                client.model,
+                CURRENT_ISO_TS,
+                response.count(" ") + bool(response),  # Approximate
+            ),
+            media_type="application/json",
         )
 
-        return {
-            "success": True,
-            "response": response,
-            "prompt": request.prompt,
-            "model": client.model,
-            "timestamp": datetime.utcnow().isoformat(),
-            "tokens_used": len(response.split()),  # Approximate
-        }
-
     except Exception as e:
-        logger.error(f"Error generating response: {e}")
+        logger.error("Error generating response: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate response: {str(e)}",
         )
 
 
-@app.post("/api/chat", response_model=ChatResponse, tags=["Claude API"])
+@app.post(
+    "/api/chat",
+    response_model=None,
+    responses={200: {"model": ChatResponse}},
+    tags=["Claude API"],
+)
 async def chat(
     message: ChatMessage,
     client: ClaudeClient = Depends(get_claude_client),
-    chat_history: List[Dict[str, str]] = [],
-) -> Dict[str, Any]:
+    x_session_id: str = Header(..., description="Chat session identifier"),
+) -> ORJSONResponse:
     """
     Chat with Claude maintaining conversation context.
 
-    Note: In a real application, you'd want to store chat history
-    in a database or session store, not as a function parameter.
+    History is kept in memory per X-Session-Id, bounded to the last
+    CHAT_HISTORY_LENGTH messages. In a multi-process deployment, use a
+    shared store such as Redis instead.
 
     Args:
         message: Chat message
         client: Claude client (injected)
-        chat_history: Conversation history (in production, use session/database)
+        x_session_id: Session identifier from the X-Session-Id header
+            (required; requests without it get a 422)
 
     Returns:
         Chat response
     """
     try:
-        # Add user message to history
+        chat_history = get_chat_history(x_session_id)
+
+        # Add user message to history (deque drops the oldest beyond the limit)
         chat_history.append({"role": "user", "content": message.message})
 
-        # Build context from recent history (last 10 messages)
-        context_messages = chat_history[-10:]
-        context_prompt = "\n".join(
-            [f"{msg['role']}: {msg['content']}" for msg in context_messages]
-        )
+        # Build context from recent history
+        context_prompt = "\n".join(f"{msg['role']}: {msg['content']}" for msg in chat_history)
 
         # Generate response
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: client.generate(
-                context_prompt + "\nassistant:", max_tokens=message.max_tokens
-            ),
+        response = await run_claude(
+            client.generate, context_prompt + "\nassistant:", max_tokens=message.max_tokens
         )
 
         # Add response to history
         chat_history.append({"role": "assistant", "content": response})
 
-        return {
-            "success": True,
-            "response": response,
-            "message_count": len(chat_history),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        return ORJSONResponse(
+            {
+                "success": True,
+                "response": response,
+                "message_count": len(chat_history),
+                "timestamp": CURRENT_ISO_TS,
+            }
+        )
 
     except Exception as e:
-        logger.error(f"Error in chat: {e}")
+        logger.error("Error in chat: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         )
@@ -375,10 +567,10 @@ async def stream_generate(
     request: GenerateRequest, client: ClaudeClient = Depends(get_claude_client)
 ) -> StreamingResponse:
     """
-    Stream generated text in chunks for better UX on long responses.
+    Stream generated text as Server-Sent Events while Claude produces it.
 
-    This simulates streaming by generating the full response and sending
-    it in chunks. For true streaming, you'd need to use Claude's streaming API.
+    Text deltas from Claude's streaming API are forwarded as they arrive,
+    so the first bytes reach the client without waiting for the full response.
 
     Args:
         request: Generation request
@@ -388,36 +580,21 @@ async def stream_generate(
         Streaming response with text chunks
     """
 
-    async def generate_chunks() -> AsyncGenerator[str, None]:
-        """Generate response in chunks."""
+    async def generate_chunks() -> AsyncGenerator[bytes, None]:
+        """Forward streamed text deltas as SSE events."""
         try:
             # Build kwargs
-            kwargs = {}
-            if request.max_tokens is not None:
-                kwargs["max_tokens"] = request.max_tokens
-            if request.temperature is not None:
-                kwargs["temperature"] = request.temperature
-            if request.system is not None:
-                kwargs["system"] = request.system
-
-            # Generate full response
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, lambda: client.generate(request.prompt, **kwargs)
-            )
-
-            # Stream in chunks (simulated)
-            chunk_size = 50  # characters per chunk
-            for i in range(0, len(response), chunk_size):
-                chunk = response[i : i + chunk_size]
-                yield f"data: {chunk}\n\n"
-                await asyncio.sleep(0.05)  # Small delay for streaming effect
-
-            yield "data: [DONE]\n\n"
+            kwargs = request.model_dump(include=GENERATE_OPTIONS, exclude_none=True)
+
+            # Forward text deltas as they arrive
+            async for delta in client.astream(request.prompt, **kwargs):
+                yield SSE_DATA_PREFIX + delta.encode("utf-8") + SSE_SEPARATOR
+
+            yield SSE_DONE
 
         except Exception as e:
-            logger.error(f"Error in streaming: {e}")
-            yield f"data: Error: {str(e)}\n\n"
+            logger.error("Error in streaming: %s", e)
+            yield SSE_DATA_PREFIX + f"Error: {e!s}".encode("utf-8") + SSE_SEPARATOR
 
     return StreamingResponse(generate_chunks(), media_type="text/event-stream")
 
@@ -428,109 +605,130 @@ async def websocket_generate(websocket: WebSocket) -> None:
     WebSocket endpoint for real-time text generation.
 
     Client sends JSON: {"prompt": "...", "max_tokens": 100}
-    Server responds with generated text
+    Server responds with one UTF-8 JSON binary frame per prompt
 
     Args:
         websocket: WebSocket connection
     """
-    await websocket.accept()
-
-    try:
-        if claude_client is None:
-            await websocket.send_json(
-                {"error": "Claude client not initialized", "success": False}
-            )
-            await websocket.close()
-            return
-
-        while True:
-            # Receive message
-            data = await websocket.receive_json()
+    # Reject with 1013 (Try Again Later) when at capacity to keep memory bounded
+    if ws_semaphore is None or ws_semaphore.locked():
+        await websocket.close(code=1013)
+        return
 
-            prompt = data.get("prompt", "").strip()
-            if not prompt:
-                await websocket.send_json({"error": "Prompt is required", "success": False})
-                continue
-
-            # Build kwargs
-            kwargs = {}
-            if "max_tokens" in data:
-                kwargs["max_tokens"] = data["max_tokens"]
-            if "temperature" in data:
-                kwargs["temperature"] = data["temperature"]
-
-            try:
-                # Send status
-                await websocket.send_json({"status": "generating", "prompt": prompt})
-
-                # Generate response (in thread pool)
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None, lambda: claude_client.generate(prompt, **kwargs)
-                )
+    async with ws_semaphore:
+        await websocket.accept()
 
-                # Send response
-                await websocket.send_json(
-                    {
-                        "success": True,
-                        "response": response,
-                        "prompt": prompt,
-                        "timestamp": datetime.utcnow().isoformat(),
-                    }
-                )
-
-            except Exception as e:
-                logger.error(f"Error in WebSocket generation: {e}")
-                await websocket.send_json({"error": str(e), "success": False})
-
-    except WebSocketDisconnect:
-        logger.info("WebSocket client disconnected")
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
         try:
+            if claude_client is None:
+                await send_json_fast(
+                    websocket, {"error": "Claude client not initialized", "success": False}
+                )
+                await websocket.close()
+                return
+
+            while True:
+                # Receive message (idle clients are disconnected)
+                data = await asyncio.wait_for(websocket.receive_json(), timeout=WS_IDLE_TIMEOUT)
+
+                prompt = data.get("prompt", "").strip()
+                if not prompt:
+                    await send_json_fast(
+                        websocket, {"error": "Prompt is required", "success": False}
+                    )
+                    continue
+
+                # Build kwargs
+                kwargs = {k: data[k] for k in ("max_tokens", "temperature") if k in data}
+
+                try:
+                    # Generate response (in thread pool)
+                    response = await run_claude(claude_client.generate, prompt, **kwargs)
+
+                    # Send response
+                    await send_json_fast(
+                        websocket,
+                        {
+                            "success": True,
+                            "response": response,
+                            "prompt": prompt,
+                            "timestamp": CURRENT_ISO_TS,
+                        },
+                    )
+
+                except Exception as e:
+                    logger.error("Error in WebSocket generation: %s", e)
+                    await send_json_fast(websocket, {"error": str(e), "success": False})
+
+        except WebSocketDisconnect:
+            logger.info("WebSocket client disconnected")
+        except asyncio.TimeoutError:
+            logger.info("Closing idle WebSocket connection")
             await websocket.close()
-        except Exception:
-            pass
+        except Exception as e:
+            logger.error("WebSocket error: %s", e)
+            try:
+                await websocket.close()
+            except Exception:
+                pass
 
 
 # Custom exception handlers
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Any, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Any, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions with custom format."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "error": exc.detail,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": CURRENT_ISO_TS,
         },
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Any, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Any, exc: Exception) -> ORJSONResponse:
     """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
             "error": "Internal server error",
             "detail": str(exc),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": CURRENT_ISO_TS,
         },
     )
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
     # Configuration
     host = os.environ.get("API_HOST", "0.0.0.0")
     port = int(os.environ.get("API_PORT", 8000))
     reload = os.environ.get("API_RELOAD", "True").lower() == "true"
-
-    logger.info(f"Starting FastAPI app on {host}:{port}")
-    logger.info(f"Reload mode: {reload}")
-
-    uvicorn.run("main:app", host=host, port=port, reload=reload)
+    workers = int(os.environ.get("API_WORKERS", 1))
+    # Set API_ACCESS_LOG=false and API_LOG_LEVEL=warning to cut logging overhead
+    access_log = os.environ.get("API_ACCESS_LOG", "True").lower() == "true"
+    log_level = os.environ.get("API_LOG_LEVEL", "info")
+
+    # uvloop is not available on Windows
+    event_loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
+    logger.info("Starting FastAPI app on %s:%s", host, port)
+    logger.info("Reload mode: %s", reload)
+
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        reload=reload,
+        loop=event_loop,
+        http="httptools",
+        workers=workers,
+        access_log=access_log,
+        log_level=log_level,
+    )
@@ -14,19 +14,41 @@ Features:
 - Health check endpoint
 - Authentication diagnostics page
 
-Run:
+Run (development):
     python app.py
 
+Run (production, gevent workers - see gunicorn.conf.py):
+    gunicorn -c gunicorn.conf.py app:app
+
 Then visit:
     http://localhost:5000
 """
 
+import hashlib
+import json
 import logging
 import os
+import re
+import secrets
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
-
-from flask import Flask, jsonify, render_template_string, request, session, stream_with_context
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache, cached
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    request,
+    session,
+    stream_with_context,
+)
+from flask.json.provider import JSONProvider
+from jinja2 import DictLoader, FileSystemBytecodeCache
 
 from claude_oauth_auth import ClaudeClient, get_auth_status
 
@@ -37,18 +59,149 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify and request.get_json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 # Create Flask app
-app = Flask(__name__)
+# No static files are served, so skip the /static route and its URL map entry
+app = Flask(__name__, static_folder=None)
+app.json = ORJSONProvider(app)
+# Match "/health/" as "/health" instead of answering with a redirect
+app.url_map.strict_slashes = False
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-key-change-in-production")
 
 # Initialize Claude client (with error handling)
 try:
-    claude_client = ClaudeClient(verbose=True)
+    claude_client = ClaudeClient(verbose=True, http2=True)
     logger.info("Claude client initialized successfully")
 except ValueError as e:
     logger.error(f"Failed to initialize Claude client: {e}")
     claude_client = None
 
+# Second-resolution ISO timestamp, formatted at most once per second per worker
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string (second resolution)."""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_at, value = _timestamp_cache
+    if cached_at != now:
+        value = datetime.utcfromtimestamp(now).isoformat()
+        # Single tuple assignment keeps the (second, string) pair consistent across threads
+        _timestamp_cache = (now, value)
+    return value
+
+
+# In-process response cache: (prompt, max_tokens, temperature) -> (response, cached_at)
+RESPONSE_CACHE_SIZE = 2048
+RESPONSE_CACHE_TTL = 3600  # seconds
+response_cache: "TTLCache[str, Tuple[str, float]]" = TTLCache(
+    maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL
+)
+response_cache_lock = threading.RLock()
+response_cache_stats = {"hits": 0, "misses": 0}
+
+
+def response_cache_key(prompt: str, kwargs: Dict[str, Any]) -> str:
+    """Build a compact cache key from the prompt digest and generation parameters."""
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{digest}:{kwargs.get('max_tokens')}:{kwargs.get('temperature')}"
+
+
+def cached_generate(prompt: str, **kwargs: Any) -> Tuple[str, bool, float]:
+    """
+    Generate a response, reusing a cached one for identical requests.
+
+    Args:
+        prompt: The prompt to send to Claude
+        **kwargs: Generation overrides passed to ClaudeClient.generate
+
+    Returns:
+        Tuple of (response, cache hit, cache age in seconds)
+    """
+    key = response_cache_key(prompt, kwargs)
+
+    with response_cache_lock:
+        entry = response_cache.get(key)
+        if entry is not None:
+            response_cache_stats["hits"] += 1
+            return entry[0], True, time.time() - entry[1]
+        response_cache_stats["misses"] += 1
+
+    # Call Claude outside the lock so concurrent misses do not serialize
+    response = claude_client.generate(prompt, **kwargs)
+
+    with response_cache_lock:
+        response_cache[key] = (response, time.time())
+
+    return response, False, 0.0
+
+
+# Prompts answered without calling Claude (see maybe_direct_response)
+MAX_PROMPT_CHARS = int(os.environ.get("MAX_PROMPT_CHARS", "100000"))
+MIN_PROMPT_CHARS = 3
+DIRECT_RESPONSES = {
+    "hi": "Hello! Ask me anything.",
+    "hello": "Hello! Ask me anything.",
+    "ping": "pong",
+}
+# Optional regex of prompts to refuse outright, e.g. DIRECT_BLOCK_PATTERN='(?i)\bpassword\b'
+_block_pattern = os.environ.get("DIRECT_BLOCK_PATTERN")
+DIRECT_BLOCK_RE = re.compile(_block_pattern) if _block_pattern else None
+
+
+def maybe_direct_response(prompt: str) -> Optional[str]:
+    """
+    Return a canned reply for prompts that do not need a Claude call.
+
+    Covers greetings and health-check style prompts, and prompts matching
+    DIRECT_BLOCK_PATTERN.
+
+    Args:
+        prompt: The stripped prompt
+
+    Returns:
+        Canned response text, or None if the prompt should go to Claude
+    """
+    canned = DIRECT_RESPONSES.get(prompt.lower())
+    if canned is not None:
+        return canned
+
+    if DIRECT_BLOCK_RE is not None and DIRECT_BLOCK_RE.search(prompt):
+        return "Sorry, I can't help with that request."
+
+    return None
+
+
+def prompt_length_error(prompt: str) -> Optional[Tuple[str, int]]:
+    """
+    Check the prompt length against MIN_PROMPT_CHARS and MAX_PROMPT_CHARS.
+
+    Args:
+        prompt: The stripped prompt
+
+    Returns:
+        Tuple of (error message, HTTP status), or None if the length is valid
+    """
+    if len(prompt) < MIN_PROMPT_CHARS:
+        return f"Prompt is too short (minimum {MIN_PROMPT_CHARS} characters)", 400
+    if len(prompt) > MAX_PROMPT_CHARS:
+        return (
+            f"Prompt is too long ({len(prompt)} characters, maximum {MAX_PROMPT_CHARS})",
+            413,
+        )
+    return None
+
 
 # HTML template for the home page
 HOME_TEMPLATE = """
@@ -183,13 +336,18 @@ HOME_TEMPLATE = """
                 <textarea id="prompt" name="prompt" placeholder="Ask Claude anything...">Explain the benefits of OAuth 2.0 authentication in 3 bullet points.</textarea>
             </div>
             <button type="submit">Generate Response</button>
+            <button type="button" id="stream-button">Stream Response</button>
         </form>
 
+        <div id="stream-output" class="response" style="display: none; white-space: pre-wrap;"></div>
+
         <div class="links">
             <h3>API Endpoints:</h3>
             <a href="/health">Health Check</a>
+            <a href="/health/deep">Deep Health Check</a>
             <a href="/auth-status">Auth Status</a>
             <a href="/api/generate?prompt=Hello%20Claude">API Example</a>
+            <a href="/api/generate/stream?prompt=Hello%20Claude">Streaming Example</a>
         </div>
 
         <h2>Example API Usage</h2>
@@ -200,8 +358,39 @@ curl -X POST http://localhost:5000/api/generate \\
 
 # GET /api/generate (simple)
 curl "http://localhost:5000/api/generate?prompt=Hello%20Claude"
+
+# GET /api/generate/stream (Server-Sent Events)
+curl -N "http://localhost:5000/api/generate/stream?prompt=Hello%20Claude"
 </code></pre>
     </div>
+
+    <script>
+        // Stream the response with Server-Sent Events, appending deltas as they arrive
+        document.getElementById("stream-button").addEventListener("click", function () {
+            var output = document.getElementById("stream-output");
+            var prompt = document.getElementById("prompt").value;
+            output.textContent = "";
+            output.style.display = "block";
+
+            var source = new EventSource("/api/generate/stream?prompt=" + encodeURIComponent(prompt));
+            source.onmessage = function (event) {
+                if (event.data === "[DONE]") {
+                    source.close();
+                    return;
+                }
+                var data = JSON.parse(event.data);
+                if (data.error) {
+                    output.textContent += "\nError: " + data.error;
+                    source.close();
+                    return;
+                }
+                output.textContent += data.delta;
+            };
+            source.onerror = function () {
+                source.close();
+            };
+        });
+    </script>
 </body>
 </html>
 """
@@ -239,6 +428,7 @@ RESPONSE_TEMPLATE = """
             border-left: 4px solid #007bff;
             border-radius: 4px;
             line-height: 1.6;
+            white-space: pre-wrap;
         }
         .error {
             background-color: #f8d7da;
@@ -270,9 +460,7 @@ RESPONSE_TEMPLATE = """
             <strong>Error:</strong> {{ error }}
         </div>
         {% else %}
-        <div class="response">
-            {{ response|safe }}
-        </div>
+        <div class="response">{{ response }}</div>
         {% endif %}
 
         <a href="/" class="back-link">← Back to Home</a>
@@ -282,56 +470,241 @@ RESPONSE_TEMPLATE = """
 """
 
 
-@app.route("/")
-def home() -> str:
-    """Home page with form and examples."""
+@cached(TTLCache(maxsize=1, ttl=60), lock=threading.Lock())
+def cached_auth_info() -> Dict[str, Any]:
+    """Return claude_client.get_auth_info(), cached for 60 seconds."""
+    return claude_client.get_auth_info()
+
+
+def private_cache_dir(path: str) -> Optional[str]:
+    """
+    Create path with mode 0o700 and return it if only this user can write to it.
+
+    Bytecode from the cache is executed, so a directory another user can
+    write to (or owns) must not be used.
+
+    Args:
+        path: Directory to use for the Jinja bytecode cache
+
+    Returns:
+        The path, or None if it is not safe to use
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.stat(path)
+    if st.st_uid != os.getuid() or st.st_mode & 0o022:
+        logger.warning(f"Ignoring JINJA_CACHE_DIR {path}: not private to this user")
+        return None
+    return path
+
+
+# Persist compiled template bytecode so restarts skip Jinja compilation.
+# from_string templates are only cached when they have a name, so load them
+# through a DictLoader. Without JINJA_CACHE_DIR, Jinja picks (and checks) a
+# per-user temp directory itself.
+JINJA_CACHE_DIR = os.environ.get("JINJA_CACHE_DIR")
+if JINJA_CACHE_DIR and private_cache_dir(JINJA_CACHE_DIR):
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+else:
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+app.jinja_loader = DictLoader({"home.html": HOME_TEMPLATE, "response.html": RESPONSE_TEMPLATE})
+
+# Compile templates once at import instead of on every request
+HOME_TPL = app.jinja_env.get_template("home.html")
+RESPONSE_TPL = app.jinja_env.get_template("response.html")
+
+# Rendered home pages and their ETags keyed by (client_available, auth_type, source, model)
+_home_html_cache: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
+
+
+def render_home() -> Tuple[str, str]:
+    """
+    Return the home page HTML and its ETag.
+
+    The page only varies with client availability and three auth_info fields,
+    so each variant is rendered once and reused until credentials change.
+
+    Returns:
+        Tuple of (html, etag)
+    """
     client_available = claude_client is not None
 
     auth_info = {}
     if client_available:
         try:
-            auth_info = claude_client.get_auth_info()
+            auth_info = cached_auth_info()
         except Exception as e:
             logger.error(f"Error getting auth info: {e}")
             client_available = False
 
-    return render_template_string(
-        HOME_TEMPLATE, client_available=client_available, auth_info=auth_info
+    cache_key = (
+        client_available,
+        auth_info.get("auth_type"),
+        auth_info.get("source"),
+        auth_info.get("model"),
     )
+    entry = _home_html_cache.get(cache_key)
+    if entry is None:
+        html = HOME_TPL.render(client_available=client_available, auth_info=auth_info)
+        entry = (html, hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest())
+        _home_html_cache[cache_key] = entry
+    return entry
+
+
+# Render the home page at import so the first visit skips Jinja too
+render_home()
+
+
+@app.route("/")
+def home() -> Response:
+    """Home page with form and examples."""
+    html, etag = render_home()
+    response = Response(html, mimetype="text/html")
+    response.set_etag(etag)
+    # Repeat visits with a matching If-None-Match get an empty 304
+    return response.make_conditional(request)
 
 
 @app.route("/generate", methods=["POST"])
 def generate_web() -> str:
     """Generate response from form submission."""
     if claude_client is None:
-        return render_template_string(
-            RESPONSE_TEMPLATE, prompt="", response="", error="Claude client not initialized"
-        )
+        return RESPONSE_TPL.render(prompt="", response="", error="Claude client not initialized")
 
     prompt = request.form.get("prompt", "").strip()
 
     if not prompt:
-        return render_template_string(
-            RESPONSE_TEMPLATE, prompt="", response="", error="Prompt cannot be empty"
-        )
+        return RESPONSE_TPL.render(prompt="", response="", error="Prompt cannot be empty")
 
-    try:
-        # Generate response using Claude
-        response = claude_client.generate(prompt)
+    direct = maybe_direct_response(prompt)
+    if direct is not None:
+        return RESPONSE_TPL.render(prompt=prompt, response=direct, error=None)
 
-        # Convert newlines to HTML breaks for display
-        response_html = response.replace("\n", "<br>")
+    length_error = prompt_length_error(prompt)
+    if length_error is not None:
+        return RESPONSE_TPL.render(prompt=prompt, response="", error=length_error[0])
 
-        return render_template_string(
-            RESPONSE_TEMPLATE, prompt=prompt, response=response_html, error=None
-        )
+    try:
+        # Generate response using Claude (or the response cache).
+        # Autoescaped; newlines are kept by white-space: pre-wrap.
+        response, _, _ = cached_generate(prompt)
+
+        return RESPONSE_TPL.render(prompt=prompt, response=response, error=None)
 
     except Exception as e:
         logger.error(f"Error generating response: {e}")
-        return render_template_string(
-            RESPONSE_TEMPLATE, prompt=prompt, response="", error=str(e)
+        return RESPONSE_TPL.render(prompt=prompt, response="", error=str(e))
+
+
+def get_generate_params() -> Tuple[str, Dict[str, Any]]:
+    """
+    Read the prompt and optional generation parameters from the request.
+
+    Accepts a JSON body for POST and query parameters for GET.
+
+    Returns:
+        Tuple of (stripped prompt, kwargs for ClaudeClient.generate)
+    """
+    max_tokens: Optional[int]
+    temperature: Optional[float]
+    if request.method == "POST":
+        data = request.get_json() or {}
+        prompt = data.get("prompt", "").strip()
+        max_tokens = data.get("max_tokens")
+        temperature = data.get("temperature")
+    else:
+        prompt = request.args.get("prompt", "").strip()
+        max_tokens = request.args.get("max_tokens", type=int)
+        temperature = request.args.get("temperature", type=float)
+
+    # Build kwargs for optional parameters
+    kwargs: Dict[str, Any] = {}
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+
+    return prompt, kwargs
+
+
+# Batch requests: prompts per request and concurrent Claude calls per batch.
+# Under gunicorn's gevent workers these threads are patched into greenlets.
+MAX_BATCH_PROMPTS = int(os.environ.get("MAX_BATCH_PROMPTS", "32"))
+BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", "8"))
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY)
+
+
+def generate_one(prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate a single batch item, capturing errors instead of raising.
+
+    Args:
+        prompt: The prompt to send to Claude
+        kwargs: Generation overrides passed to ClaudeClient.generate
+
+    Returns:
+        Result dictionary for the prompt
+    """
+    prompt = prompt.strip() if isinstance(prompt, str) else ""
+    if not prompt:
+        return {"success": False, "prompt": prompt, "error": "Prompt is required"}
+
+    direct = maybe_direct_response(prompt)
+    if direct is not None:
+        return {"success": True, "prompt": prompt, "response": direct, "cache": "DIRECT"}
+
+    length_error = prompt_length_error(prompt)
+    if length_error is not None:
+        return {"success": False, "prompt": prompt, "error": length_error[0]}
+
+    try:
+        response, cache_hit, _ = cached_generate(prompt, **kwargs)
+        return {
+            "success": True,
+            "prompt": prompt,
+            "response": response,
+            "cache": "HIT" if cache_hit else "MISS",
+        }
+    except Exception as e:
+        logger.error(f"Error in batch generation: {e}")
+        return {"success": False, "prompt": prompt, "error": str(e)}
+
+
+def generate_batch(prompts: List[Any], kwargs: Dict[str, Any]) -> Any:
+    """
+    Generate responses for several prompts concurrently.
+
+    Args:
+        prompts: Prompts from the request body
+        kwargs: Generation overrides shared by all prompts
+
+    Returns:
+        JSON response with one result per prompt, in input order
+    """
+    if not prompts:
+        return jsonify({"error": "Prompts list is empty", "success": False}), 400
+    if len(prompts) > MAX_BATCH_PROMPTS:
+        return (
+            jsonify(
+                {
+                    "error": f"Too many prompts (maximum {MAX_BATCH_PROMPTS})",
+                    "success": False,
+                }
+            ),
+            400,
         )
 
+    # executor.map yields results in input order while the calls run concurrently
+    responses = list(batch_executor.map(lambda p: generate_one(p, kwargs), prompts))
+
+    return jsonify(
+        {
+            "success": all(r["success"] for r in responses),
+            "responses": responses,
+            "timestamp": now_iso(),
+            "model": claude_client.model,
+        }
+    )
+
 
 @app.route("/api/generate", methods=["GET", "POST"])
 def generate_api() -> Any:
@@ -340,63 +713,168 @@ def generate_api() -> Any:
 
     GET /api/generate?prompt=Hello&max_tokens=100
     POST /api/generate with JSON body: {"prompt": "...", "max_tokens": 100}
+    POST /api/generate with JSON body: {"prompts": ["...", "..."], "max_tokens": 100}
 
     Returns:
-        JSON response with generated text or error
+        JSON response with generated text (or one result per prompt) or error
     """
     if claude_client is None:
         return jsonify({"error": "Claude client not initialized", "success": False}), 503
 
-    # Get parameters from either GET or POST
+    prompt, kwargs = get_generate_params()
+
     if request.method == "POST":
-        data = request.get_json() or {}
-        prompt = data.get("prompt", "").strip()
-        max_tokens = data.get("max_tokens")
-        temperature = data.get("temperature")
-    else:
-        prompt = request.args.get("prompt", "").strip()
-        max_tokens = request.args.get("max_tokens", type=int)
-        temperature = request.args.get("temperature", type=float)
+        prompts = (request.get_json() or {}).get("prompts")
+        if isinstance(prompts, list):
+            return generate_batch(prompts, kwargs)
 
     if not prompt:
         return jsonify({"error": "Prompt is required", "success": False}), 400
 
-    try:
-        # Build kwargs for optional parameters
-        kwargs = {}
-        if max_tokens is not None:
-            kwargs["max_tokens"] = max_tokens
-        if temperature is not None:
-            kwargs["temperature"] = temperature
+    direct = maybe_direct_response(prompt)
+    if direct is not None:
+        result = jsonify(
+            {
+                "success": True,
+                "response": direct,
+                "prompt": prompt,
+                "timestamp": now_iso(),
+                "model": claude_client.model,
+                "cache_age": 0.0,
+            }
+        )
+        result.headers["X-Cache"] = "DIRECT"
+        return result
 
-        # Generate response
-        response = claude_client.generate(prompt, **kwargs)
+    length_error = prompt_length_error(prompt)
+    if length_error is not None:
+        message, status = length_error
+        return jsonify({"error": message, "success": False}), status
 
-        return jsonify(
+    try:
+        # Generate response (or reuse a cached one)
+        response, cache_hit, cache_age = cached_generate(prompt, **kwargs)
+
+        result = jsonify(
             {
                 "success": True,
                 "response": response,
                 "prompt": prompt,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
                 "model": claude_client.model,
+                "cache_age": round(cache_age, 3),
             }
         )
+        result.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+        return result
 
     except Exception as e:
         logger.error(f"Error in API generation: {e}")
         return jsonify({"error": str(e), "success": False, "prompt": prompt}), 500
 
 
+@app.route("/api/generate/stream", methods=["GET", "POST"])
+def generate_stream() -> Any:
+    """
+    Streaming API endpoint using Server-Sent Events.
+
+    Accepts the same parameters as /api/generate. Each event carries a JSON
+    object {"delta": "..."} with text as Claude produces it; the stream ends
+    with "data: [DONE]".
+
+    Returns:
+        text/event-stream response, or JSON error
+    """
+    if claude_client is None:
+        return jsonify({"error": "Claude client not initialized", "success": False}), 503
+
+    prompt, kwargs = get_generate_params()
+
+    if not prompt:
+        return jsonify({"error": "Prompt is required", "success": False}), 400
+
+    def events() -> Any:
+        try:
+            for text in claude_client.stream(prompt, **kwargs):
+                yield f"data: {app.json.dumps({'delta': text})}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            logger.error(f"Error in streaming generation: {e}")
+            yield f"data: {app.json.dumps({'error': str(e)})}\n\n"
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        # Disable caching and proxy buffering so deltas reach the client immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/cache/stats")
+def cache_stats() -> Any:
+    """Response cache statistics."""
+    with response_cache_lock:
+        hits = response_cache_stats["hits"]
+        misses = response_cache_stats["misses"]
+        size = len(response_cache)
+
+    total = hits + misses
+    return jsonify(
+        {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "size": size,
+            "max_size": RESPONSE_CACHE_SIZE,
+            "ttl": RESPONSE_CACHE_TTL,
+        }
+    )
+
+
+@app.route("/cache/clear", methods=["POST"])
+def cache_clear() -> Any:
+    """Clear the response cache and its statistics."""
+    with response_cache_lock:
+        response_cache.clear()
+        response_cache_stats["hits"] = 0
+        response_cache_stats["misses"] = 0
+    return jsonify({"success": True, "message": "Response cache cleared"})
+
+
 @app.route("/health")
 def health_check() -> Any:
-    """Health check endpoint for monitoring."""
+    """Liveness check for load balancers: only verifies the client exists."""
+    if claude_client is None:
+        return (
+            jsonify(
+                {
+                    "status": "unhealthy",
+                    "claude_client": "not initialized",
+                    "timestamp": now_iso(),
+                }
+            ),
+            503,
+        )
+
+    return jsonify(
+        {
+            "status": "healthy",
+            "claude_client": "initialized",
+            "timestamp": now_iso(),
+        }
+    )
+
+
+@app.route("/health/deep")
+def health_check_deep() -> Any:
+    """Readiness check: also verifies the client's authentication info."""
     if claude_client is None:
         return (
             jsonify(
                 {
                     "status": "unhealthy",
                     "claude_client": "not initialized",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso(),
                 }
             ),
             503,
@@ -412,7 +890,7 @@ def health_check() -> Any:
                 "claude_client": "initialized",
                 "auth_type": auth_info["auth_type"],
                 "model": auth_info["model"],
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
         )
 
@@ -423,7 +901,7 @@ def health_check() -> Any:
                 {
                     "status": "unhealthy",
                     "error": str(e),
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso(),
                 }
             ),
             503,
@@ -441,7 +919,7 @@ def auth_status_page() -> Any:
                 "success": True,
                 "status": status,
                 "client_initialized": claude_client is not None,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
         )
 
@@ -450,12 +928,126 @@ def auth_status_page() -> Any:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Chat history is kept server-side; the signed session cookie only carries a chat id
+CHAT_HISTORY_LENGTH = 50  # messages sent as context
+CHAT_SESSION_TTL = 86400  # seconds
+
+
+class MemoryChatStore:
+    """In-process chat history store, used when REDIS_URL is not set (single worker)."""
+
+    def __init__(self) -> None:
+        self._sessions: "TTLCache[str, Dict[str, Any]]" = TTLCache(
+            maxsize=10_000, ttl=CHAT_SESSION_TTL
+        )
+        self._lock = threading.Lock()
+
+    def recent(self, chat_id: str) -> List[Dict[str, str]]:
+        """Return the retained messages for a chat, oldest first."""
+        with self._lock:
+            entry = self._sessions.get(chat_id)
+            return list(entry["messages"]) if entry else []
+
+    def append(self, chat_id: str, message: Dict[str, str]) -> int:
+        """Append a message and return the total number of messages in the chat."""
+        with self._lock:
+            entry = self._sessions.get(chat_id)
+            if entry is None:
+                entry = {"messages": deque(maxlen=CHAT_HISTORY_LENGTH), "count": 0}
+            entry["messages"].append(message)
+            entry["count"] += 1
+            # Re-insert to refresh the TTL
+            self._sessions[chat_id] = entry
+            return int(entry["count"])
+
+    def clear(self, chat_id: str) -> None:
+        """Delete a chat's history."""
+        with self._lock:
+            self._sessions.pop(chat_id, None)
+
+
+class RedisChatStore:
+    """Redis-backed chat history store, shared by all workers."""
+
+    def __init__(self, redis_client: Any) -> None:
+        self.redis = redis_client
+
+    def recent(self, chat_id: str) -> List[Dict[str, str]]:
+        """Return the retained messages for a chat, oldest first."""
+        return [json.loads(m) for m in self.redis.lrange(f"chat:{chat_id}", 0, -1)]
+
+    def append(self, chat_id: str, message: Dict[str, str]) -> int:
+        """Append a message and return the total number of messages in the chat."""
+        key = f"chat:{chat_id}"
+        count_key = f"chat:{chat_id}:count"
+        pipe = self.redis.pipeline()
+        pipe.rpush(key, json.dumps(message))
+        pipe.ltrim(key, -CHAT_HISTORY_LENGTH, -1)
+        pipe.expire(key, CHAT_SESSION_TTL)
+        pipe.incr(count_key)
+        pipe.expire(count_key, CHAT_SESSION_TTL)
+        return int(pipe.execute()[3])
+
+    def clear(self, chat_id: str) -> None:
+        """Delete a chat's history."""
+        self.redis.delete(f"chat:{chat_id}", f"chat:{chat_id}:count")
+
+
+def create_chat_store() -> Any:
+    """Use Redis when REDIS_URL is set, otherwise keep chat history in memory."""
+    redis_url = os.environ.get("REDIS_URL")
+    if not redis_url:
+        return MemoryChatStore()
+
+    import redis
+
+    logger.info("Storing chat history in Redis")
+    return RedisChatStore(redis.Redis.from_url(redis_url))
+
+
+chat_store = create_chat_store()
+
+
+def build_chat_messages(history: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Convert stored chat history into Messages API turns with a cached prefix.
+
+    The turn before the newest user message is marked with cache_control, so
+    Anthropic can reuse the already-processed conversation prefix across turns
+    instead of re-reading the whole history each time.
+
+    Args:
+        history: Stored messages, oldest first, ending with the new user message
+
+    Returns:
+        Messages for ClaudeClient.chat
+    """
+    # The conversation must start with a user turn; trimming may leave an assistant first
+    start = 0
+    while start < len(history) and history[start]["role"] != "user":
+        start += 1
+    messages: List[Dict[str, Any]] = [dict(m) for m in history[start:]]
+
+    if len(messages) >= 2:
+        prefix_end = messages[-2]
+        prefix_end["content"] = [
+            {
+                "type": "text",
+                "text": prefix_end["content"],
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    return messages
+
+
 @app.route("/chat", methods=["POST"])
 def chat() -> Any:
     """
     Chat endpoint with session-based history.
 
-    Maintains conversation context across multiple requests.
+    Maintains conversation context across multiple requests. History lives in
+    the chat store (Redis or memory); the session cookie holds only a chat id.
     """
     if claude_client is None:
         return jsonify({"error": "Claude client not initialized", "success": False}), 503
@@ -467,31 +1059,30 @@ def chat() -> Any:
         return jsonify({"error": "Message is required", "success": False}), 400
 
     try:
-        # Get or initialize chat history from session
-        if "chat_history" not in session:
-            session["chat_history"] = []
+        # Get or create this session's chat id
+        chat_id = session.get("chat_id")
+        if chat_id is None:
+            chat_id = secrets.token_urlsafe(16)
+            session["chat_id"] = chat_id
 
         # Add user message to history
-        session["chat_history"].append({"role": "user", "content": user_message})
+        chat_store.append(chat_id, {"role": "user", "content": user_message})
 
-        # Build context from history (last 5 messages)
-        context_messages = session["chat_history"][-5:]
-        context_prompt = "\n".join([f"{msg['role']}: {msg['content']}" for msg in context_messages])
+        # Send history as native Messages API turns (last CHAT_HISTORY_LENGTH messages)
+        messages = build_chat_messages(chat_store.recent(chat_id))
 
         # Generate response
-        response = claude_client.generate(
-            context_prompt + "\nassistant:", max_tokens=data.get("max_tokens", 1000)
-        )
+        response = claude_client.chat(messages, max_tokens=data.get("max_tokens", 1000))
 
         # Add assistant response to history
-        session["chat_history"].append({"role": "assistant", "content": response})
+        message_count = chat_store.append(chat_id, {"role": "assistant", "content": response})
 
         return jsonify(
             {
                 "success": True,
                 "response": response,
-                "message_count": len(session["chat_history"]),
-                "timestamp": datetime.utcnow().isoformat(),
+                "message_count": message_count,
+                "timestamp": now_iso(),
             }
         )
 
@@ -503,7 +1094,9 @@ def chat() -> Any:
 @app.route("/chat/reset", methods=["POST"])
 def reset_chat() -> Any:
     """Reset chat history."""
-    session.pop("chat_history", None)
+    chat_id = session.pop("chat_id", None)
+    if chat_id is not None:
+        chat_store.clear(chat_id)
     return jsonify({"success": True, "message": "Chat history reset"})
 
 
@@ -535,4 +1128,5 @@ if __name__ == "__main__":
     else:
         logger.warning("Claude client not initialized - app will have limited functionality")
 
+    # Development server only; use gunicorn.conf.py (gevent workers) in production
     app.run(host=host, port=port, debug=debug)
@@ -0,0 +1,62 @@
+"""
+Gunicorn configuration for the Flask example.
+
+Every route spends most of its time waiting on the Claude API, so gevent
+workers are used: each worker serves many concurrent requests on green
+threads instead of tying up one OS thread per in-flight Claude call.
+
+Run:
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+# Patch the standard library before the app (and the Anthropic SDK's HTTP
+# stack) is imported, so blocking socket I/O yields to other greenlets.
+from gevent import monkey
+
+
+monkey.patch_all()
+
+import multiprocessing  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+from typing import Any  # noqa: E402
+
+
+# Server socket
+bind = f"{os.environ.get('FLASK_HOST', '0.0.0.0')}:{os.environ.get('FLASK_PORT', 5000)}"
+
+# Worker processes. Without REDIS_URL chat history lives in each worker's
+# memory, so default to a single worker to keep every chat on one process.
+_default_workers = multiprocessing.cpu_count() if os.environ.get("REDIS_URL") else 1
+workers = int(os.environ.get("GUNICORN_WORKERS", _default_workers))
+worker_class = "gevent"
+worker_connections = 1000
+
+# Keep client connections open between requests
+keepalive = 5
+
+# Import the app (and initialize claude_client) once in the master, then fork
+preload_app = True
+
+
+def on_starting(server: Any) -> None:
+    """Warn when in-memory chat history would be split across workers."""
+    if workers > 1 and not os.environ.get("REDIS_URL"):
+        server.log.warning(
+            f"Running {workers} workers without REDIS_URL: chat history is kept per "
+            f"worker, so conversations will lose context. Set REDIS_URL or use 1 worker."
+        )
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """
+    Give each worker its own Anthropic connection pool.
+
+    With preload_app the master discovers credentials once and every worker
+    inherits them. Sockets must not be shared across processes, so only the
+    HTTP clients are rebuilt here.
+    """
+    app_module = sys.modules.get("app")
+    claude_client = getattr(app_module, "claude_client", None)
+    if claude_client is not None:
+        claude_client.reset_connections()
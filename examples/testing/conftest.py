@@ -6,7 +6,7 @@ across all test files in this directory.
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from claude_oauth_auth import ClaudeClient
 
@@ -36,6 +36,21 @@ def mock_claude_client():
     return mock_client
 
 
+@pytest.fixture
+def async_mock_claude_client():
+    """
+    Fixture providing a mock Claude client for async code.
+
+    Returns:
+        Mock ClaudeClient instance whose agenerate is an AsyncMock
+    """
+    mock_client = Mock(spec=ClaudeClient)
+    mock_client.agenerate = AsyncMock(return_value="Mocked response")
+    mock_client.model = "claude-sonnet-4-5-20250929"
+
+    return mock_client
+
+
 @pytest.fixture
 def client_fixture():
     """
@@ -17,6 +17,9 @@ Run:
     pytest test_with_claude.py --cov
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -45,6 +48,28 @@ def analyze_text(text: str, client: ClaudeClient) -> dict:
     }
 
 
+async def analyze_text_async(text: str, client) -> dict:
+    """
+    Async variant of analyze_text using ClaudeClient.agenerate().
+
+    Lets callers analyze many texts concurrently with asyncio.gather.
+
+    Args:
+        text: Text to analyze
+        client: Claude client instance
+
+    Returns:
+        Analysis results
+    """
+    prompt = f"Analyze this text and provide sentiment, key topics, and summary:\n\n{text}"
+    response = await client.agenerate(prompt, max_tokens=500)
+    return {
+        "original_text": text,
+        "analysis": response,
+        "success": True
+    }
+
+
 def summarize_content(content: str, max_words: int = 100) -> str:
     """
     Example function that summarizes content using Claude.
@@ -166,7 +191,7 @@ class TestAuthenticationMocking:
 
         # This would normally discover real credentials
         # Now uses mocked credentials
-        with patch("claude_oauth_auth.client.Anthropic"):
+        with patch("anthropic.Anthropic"):
             client = ClaudeClient()
             assert client.credentials == mock_credentials
 
@@ -248,11 +273,15 @@ pytestmark = [
 ]
 
 
-# Example of parameterized tests
+# Built once at import rather than inside the parametrize list
+LONG_TEXT = "Very long text that needs more tokens" * 10
+
+
+# Example of parameterized tests (ids keep `pytest -v` output readable)
 @pytest.mark.parametrize("text,expected_length", [
-    ("Short", 100),
-    ("Medium length text here", 200),
-    ("Very long text that needs more tokens" * 10, 500),
+    pytest.param("Short", 100, id="short"),
+    pytest.param("Medium length text here", 200, id="medium"),
+    pytest.param(LONG_TEXT, 500, id="long"),
 ])
 def test_text_length_handling(text, expected_length):
     """Test handling different text lengths."""
@@ -282,17 +311,18 @@ def test_with_client_fixture(client_fixture):
 
 # Performance test example
 @pytest.mark.slow
-def test_batch_processing_performance(mock_claude_client):
-    """Test performance of batch processing."""
-    import time
-
+@pytest.mark.asyncio
+async def test_batch_processing_performance(async_mock_claude_client):
+    """Test performance of concurrent batch processing."""
     texts = [f"Text {i}" for i in range(100)]
 
-    start = time.time()
-    for text in texts:
-        analyze_text(text, mock_claude_client)
-    duration = time.time() - start
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(analyze_text_async(text, async_mock_claude_client) for text in texts)
+    )
+    duration = time.perf_counter() - start
 
     # Should process 100 items quickly with mocks
     assert duration < 1.0  # Less than 1 second
-    assert mock_claude_client.generate.call_count == 100
+    assert all(result["success"] for result in results)
+    assert async_mock_claude_client.agenerate.await_count == 100
@@ -20,35 +20,129 @@ Options:
     --dry-run          Show what would be done without making changes
 """
 
-import argparse
+import os
 import re
-import subprocess
+import shutil
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+
+if TYPE_CHECKING:
+    import argparse
+
+
+# Patterns compiled once at import
+# Version lines are anchored on a literal leading newline instead of
+# re.MULTILINE, letting the engine scan for the literal prefix. Neither file
+# can have its version on the first line (pyproject.toml opens with a table
+# header, __init__.py with its docstring).
+_VERSION_RE = re.compile(r'\nversion\s*=\s*"([^"]+)"')
+_INIT_VERSION_RE = re.compile(r'\n__version__ = "([^"]+)"')
+_SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+_UNRELEASED_RE = re.compile(r"## \[Unreleased\].*?(?=\n## \[|$)", re.DOTALL)
+_LINK_RE = re.compile(
+    r"\[Unreleased\]: (https://github\.com/[^/]+/[^/]+)/compare/v([^.]+\.[^.]+\.[^.]+)\.\.\.HEAD"
+)
+
+# Fresh [Unreleased] section inserted above each released version
+_UNRELEASED_TEMPLATE = """## [Unreleased]
+
+### Added
+- Features to be added
+
+### Changed
+- Changes to be made
+
+### Fixed
+- Bugs to be fixed
+
+"""
+_VERSION_HEADER_TEMPLATE = "## [{version}] - {date}"
 
 
 class VersionBumper:
     """Handles version bumping for the project."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, root_entries: Optional[Set[str]] = None):
+        """
+        Set up file paths for the project.
+
+        Args:
+            project_root: Directory containing pyproject.toml
+            root_entries: Names present in project_root, if already listed;
+                used to skip files known to be missing without a stat
+        """
         self.project_root = project_root
+        self.root_entries = root_entries
+        # Stringified once for the git -C argument
+        self._root_str = str(project_root)
         self.pyproject_path = project_root / "pyproject.toml"
-        self.init_path = project_root / "src" / "claude_oauth_auth" / "__init__.py"
+        self.init_path = project_root.joinpath("src", "claude_oauth_auth", "__init__.py")
         self.changelog_path = project_root / "CHANGELOG.md"
+        # File contents read so far, and updated contents waiting for flush()
+        self._contents: Dict[Path, str] = {}
+        self._pending: Dict[Path, str] = {}
+
+    def _read(self, path: Path) -> str:
+        """Read a file once, returning the cached (possibly updated) contents afterwards."""
+        content = self._contents.get(path)
+        if content is None:
+            content = self._contents[path] = path.read_text(encoding="utf-8")
+        return content
+
+    def _write(self, path: Path, content: str) -> None:
+        """Stage new file contents; nothing touches disk until flush()."""
+        self._contents[path] = content
+        self._pending[path] = content
+
+    def flush(self) -> None:
+        """Write all staged file updates to disk."""
+        for path, content in self._pending.items():
+            # Write a sibling temp file in one call, then atomically swap it in so
+            # an interrupted run never leaves a half-written file behind
+            tmp_path = path.with_name(path.name + ".bump")
+            try:
+                with open(
+                    tmp_path, "w", encoding="utf-8", buffering=max(8192, len(content))
+                ) as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # Keep the original permissions (e.g. the executable bit)
+                shutil.copymode(path, tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                # Only still there if the write or swap failed
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            print(f"✅ Updated {path}")
+        self._pending.clear()
 
     def get_current_version(self) -> str:
         """Extract current version from pyproject.toml."""
-        content = self.pyproject_path.read_text()
-        match = re.search(r'^version\s*=\s*"([^"]+)"', content, re.MULTILINE)
-        if not match:
-            raise ValueError("Could not find version in pyproject.toml")
-        return match.group(1)
+        content = self._read(self.pyproject_path)
+        try:
+            if sys.version_info >= (3, 11):
+                import tomllib
+            else:
+                import tomli as tomllib
+
+            version = tomllib.loads(content).get("project", {}).get("version")
+            if not version:
+                raise ValueError("Could not find version in pyproject.toml")
+            return str(version)
+        except ImportError:
+            # Fall back to a regex scan if no TOML parser is available (3.8-3.10 without tomli)
+            match = _VERSION_RE.search(content)
+            if not match:
+                raise ValueError("Could not find version in pyproject.toml")
+            return match.group(1)
 
     def parse_version(self, version: str) -> Tuple[int, int, int]:
         """Parse version string into (major, minor, patch)."""
-        match = re.match(r"^(\d+)\.(\d+)\.(\d+)$", version)
+        match = _SEMVER_RE.match(version)
         if not match:
             raise ValueError(f"Invalid version format: {version}")
         return tuple(map(int, match.groups()))
@@ -68,85 +162,78 @@ class VersionBumper:
 
     def update_pyproject(self, old_version: str, new_version: str, dry_run: bool = False) -> None:
         """Update version in pyproject.toml."""
-        content = self.pyproject_path.read_text()
-        old_pattern = f'version = "{old_version}"'
-        new_pattern = f'version = "{new_version}"'
-
-        if old_pattern not in content:
-            raise ValueError(f"Could not find '{old_pattern}' in pyproject.toml")
+        content = self._read(self.pyproject_path)
+        new_line = f'version = "{new_version}"'
 
-        new_content = content.replace(old_pattern, new_pattern)
+        # Locate the [project] version line once and splice the new line in
+        match = _VERSION_RE.search(content)
+        if not match or match.group(1) != old_version:
+            raise ValueError(f"Could not find 'version = \"{old_version}\"' in pyproject.toml")
+        new_content = f"{content[: match.start()]}\n{new_line}{content[match.end() :]}"
 
         if dry_run:
             print(f"[DRY RUN] Would update {self.pyproject_path}")
-            print(f"  {old_pattern} -> {new_pattern}")
+            print(f"  {match.group(0).lstrip()} -> {new_line}")
         else:
-            self.pyproject_path.write_text(new_content)
-            print(f"✅ Updated {self.pyproject_path}")
+            self._write(self.pyproject_path, new_content)
 
     def update_init(self, old_version: str, new_version: str, dry_run: bool = False) -> None:
         """Update version in __init__.py."""
-        content = self.init_path.read_text()
-        old_pattern = f'__version__ = "{old_version}"'
-        new_pattern = f'__version__ = "{new_version}"'
-
-        if old_pattern not in content:
-            raise ValueError(f"Could not find '{old_pattern}' in {self.init_path}")
+        content = self._read(self.init_path)
+        new_line = f'__version__ = "{new_version}"'
 
-        new_content = content.replace(old_pattern, new_pattern)
+        match = _INIT_VERSION_RE.search(content)
+        if not match or match.group(1) != old_version:
+            raise ValueError(
+                f"Could not find '__version__ = \"{old_version}\"' in {self.init_path}"
+            )
+        new_content = f"{content[: match.start()]}\n{new_line}{content[match.end() :]}"
 
         if dry_run:
             print(f"[DRY RUN] Would update {self.init_path}")
-            print(f"  {old_pattern} -> {new_pattern}")
+            print(f"  {match.group(0).lstrip()} -> {new_line}")
         else:
-            self.init_path.write_text(new_content)
-            print(f"✅ Updated {self.init_path}")
+            self._write(self.init_path, new_content)
 
     def update_changelog(self, new_version: str, dry_run: bool = False) -> None:
         """Update CHANGELOG.md with new version section."""
-        if not self.changelog_path.exists():
+        if self.root_entries is not None and self.changelog_path.name not in self.root_entries:
             print(f"⚠️  {self.changelog_path} not found, skipping")
             return
 
-        content = self.changelog_path.read_text()
-        today = datetime.now().strftime("%Y-%m-%d")
+        # Open directly instead of stat-ing first; a missing file is the rare case
+        try:
+            content = self._read(self.changelog_path)
+        except FileNotFoundError:
+            print(f"⚠️  {self.changelog_path} not found, skipping")
+            return
+
+        # Imported here so runs that skip the changelog never load datetime
+        from datetime import date
+
+        today = date.today().isoformat()
 
         # Find the [Unreleased] section
-        unreleased_pattern = r"## \[Unreleased\].*?(?=\n## \[|$)"
-        unreleased_match = re.search(unreleased_pattern, content, re.DOTALL)
+        unreleased_match = _UNRELEASED_RE.search(content)
 
         if not unreleased_match:
             print("⚠️  No [Unreleased] section found in CHANGELOG.md, skipping")
             return
 
-        unreleased_section = unreleased_match.group(0)
-
         # Create new version section
-        new_version_section = f"## [{new_version}] - {today}"
-
-        # Replace [Unreleased] with new version and create new [Unreleased]
-        new_unreleased = """## [Unreleased]
-
-### Added
-- Features to be added
-
-### Changed
-- Changes to be made
-
-### Fixed
-- Bugs to be fixed
-
-"""
-        # Replace the old [Unreleased] header with new version
-        updated_section = unreleased_section.replace("## [Unreleased]", new_version_section)
-
-        # Insert new [Unreleased] section at the top
-        new_content = content.replace(unreleased_section, new_unreleased + "\n" + updated_section)
+        new_version_section = _VERSION_HEADER_TEMPLATE.format(version=new_version, date=today)
+
+        # Everything after the old [Unreleased] header moves under the new version header
+        body_start = unreleased_match.start() + len("## [Unreleased]")
+        parts = [
+            content[: unreleased_match.start()],
+            _UNRELEASED_TEMPLATE,
+            "\n",
+            new_version_section,
+        ]
 
-        # Update the comparison links at the bottom
-        # Find existing link pattern
-        link_pattern = r"\[Unreleased\]: (https://github\.com/[^/]+/[^/]+)/compare/v([^.]+\.[^.]+\.[^.]+)\.\.\.HEAD"
-        link_match = re.search(link_pattern, new_content)
+        # Update the comparison links at the bottom, located in the original content
+        link_match = _LINK_RE.search(content, body_start)
 
         if link_match:
             repo_url = link_match.group(1)
@@ -156,23 +243,32 @@ class VersionBumper:
             new_unreleased_link = f"[Unreleased]: {repo_url}/compare/v{new_version}...HEAD"
             new_version_link = f"[{new_version}]: {repo_url}/compare/v{last_version}...v{new_version}"
 
-            # Replace old unreleased link and add new version link
-            old_link = link_match.group(0)
-            new_content = new_content.replace(
-                old_link, new_unreleased_link + "\n" + new_version_link
-            )
+            parts += [
+                content[body_start : link_match.start()],
+                new_unreleased_link,
+                "\n",
+                new_version_link,
+                content[link_match.end() :],
+            ]
+        else:
+            parts.append(content[body_start:])
+
+        # Build the new file in one allocation
+        new_content = "".join(parts)
 
         if dry_run:
             print(f"[DRY RUN] Would update {self.changelog_path}")
             print(f"  Would add section: {new_version_section}")
         else:
-            self.changelog_path.write_text(new_content)
-            print(f"✅ Updated {self.changelog_path}")
+            self._write(self.changelog_path, new_content)
 
     def create_git_commit_and_tag(
         self, version: str, dry_run: bool = False
     ) -> None:
         """Create git commit and tag for the version bump."""
+        # Only needed when committing; dry runs and --no-commit skip the import
+        import subprocess
+
         files_to_commit = [
             "pyproject.toml",
             "src/claude_oauth_auth/__init__.py",
@@ -184,31 +280,32 @@ class VersionBumper:
 
         if dry_run:
             print(f"[DRY RUN] Would create git commit and tag:")
-            print(f"  git add {' '.join(files_to_commit)}")
-            print(f'  git commit -m "{commit_message}"')
+            print(f"  git commit --only {' '.join(files_to_commit)} -m \"{commit_message}\"")
             print(f'  git tag -a v{version} -m "{tag_message}"')
             return
 
-        try:
-            # Add files
-            subprocess.run(
-                ["git", "add"] + files_to_commit,
-                check=True,
-                cwd=self.project_root,
-            )
+        git_path = shutil.which("git")
+        if git_path is None:
+            print("❌ git not found on PATH")
+            print("   You may need to commit and tag manually")
+            sys.exit(1)
+        git = [git_path, "-C", self._root_str]
 
-            # Commit
+        try:
+            # Commit only the release files; --only stages them itself, so no git add
             subprocess.run(
-                ["git", "commit", "-m", commit_message],
+                git + ["commit", "--only", *files_to_commit, "-m", commit_message],
                 check=True,
-                cwd=self.project_root,
+                capture_output=True,
+                stdin=subprocess.DEVNULL,
             )
 
             # Tag
             subprocess.run(
-                ["git", "tag", "-a", f"v{version}", "-m", tag_message],
+                git + ["tag", "-a", f"v{version}", "-m", tag_message],
                 check=True,
-                cwd=self.project_root,
+                capture_output=True,
+                stdin=subprocess.DEVNULL,
             )
 
             print(f"✅ Created git commit and tag v{version}")
@@ -219,12 +316,52 @@ class VersionBumper:
 
         except subprocess.CalledProcessError as e:
             print(f"❌ Git operation failed: {e}")
+            if e.stderr:
+                print(f"   {e.stderr.decode(errors='replace').strip()}")
             print("   You may need to commit and tag manually")
             sys.exit(1)
 
 
-def main() -> None:
-    """Main entry point."""
+_BUMP_TYPES = ("major", "minor", "patch")
+_FLAGS = {"--no-commit": "no_commit", "--no-changelog": "no_changelog", "--dry-run": "dry_run"}
+
+
+def parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common invocations without importing argparse.
+
+    Handles one bump type, --version X / --version=X and the boolean flags.
+    Anything else (--help, abbreviations, invalid input) returns None so the
+    full argparse parser can produce its usual help and error messages.
+    """
+    args = SimpleNamespace(
+        bump_type=None, version=None, no_commit=False, no_changelog=False, dry_run=False
+    )
+    it = iter(argv)
+    for arg in it:
+        if arg in _FLAGS:
+            setattr(args, _FLAGS[arg], True)
+        elif arg in _BUMP_TYPES and args.bump_type is None:
+            args.bump_type = arg
+        elif arg == "--version":
+            value = next(it, None)
+            if value is None or value.startswith("-"):
+                return None
+            args.version = value
+        elif arg.startswith("--version="):
+            args.version = arg[len("--version=") :]
+        else:
+            return None
+
+    if not args.version and not args.bump_type:
+        return None
+    return args
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    """Build the full argparse parser, used for --help and invalid arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Bump version for claude-oauth-auth",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -241,7 +378,7 @@ Examples:
     parser.add_argument(
         "bump_type",
         nargs="?",
-        choices=["major", "minor", "patch"],
+        choices=list(_BUMP_TYPES),
         help="Type of version bump",
     )
     parser.add_argument(
@@ -263,22 +400,33 @@ Examples:
         action="store_true",
         help="Show what would be done without making changes",
     )
+    return parser
 
-    args = parser.parse_args()
 
-    # Validate arguments
-    if not args.version and not args.bump_type:
-        parser.error("Must specify either bump_type or --version")
+def main() -> None:
+    """Main entry point."""
+    args: Any = parse_args_fast(sys.argv[1:])
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args()
+
+        # Validate arguments
+        if not args.version and not args.bump_type:
+            parser.error("Must specify either bump_type or --version")
 
     # Find project root (directory containing pyproject.toml)
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
 
-    if not (project_root / "pyproject.toml").exists():
+    # One directory listing answers every top-level existence check
+    with os.scandir(project_root) as entries:
+        root_entries = {entry.name for entry in entries}
+
+    if "pyproject.toml" not in root_entries:
         print("❌ Could not find pyproject.toml in project root")
         sys.exit(1)
 
-    bumper = VersionBumper(project_root)
+    bumper = VersionBumper(project_root, root_entries)
 
     try:
         # Get current version
@@ -313,6 +461,10 @@ Examples:
         if not args.no_changelog:
             bumper.update_changelog(new_version, args.dry_run)
 
+        # Write everything only after all updates succeeded
+        if not args.dry_run:
+            bumper.flush()
+
         # Create git commit and tag
         if not args.no_commit and not args.dry_run:
             print("\n🔧 Creating git commit and tag...")
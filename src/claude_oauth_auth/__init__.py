@@ -31,6 +31,7 @@ Public API:
 
     Authentication Managers:
         - UnifiedAuthManager: Comprehensive authentication discovery
+        - get_auth_manager: Shared UnifiedAuthManager with cached discovery
         - OAuthTokenManager: OAuth token management for Claude Code
 
     Authentication Discovery:
@@ -54,43 +55,90 @@ __version__ = "0.1.0"
 __author__ = "AI Scientist Team"
 __license__ = "MIT"
 
-# Import main client
-# Import authentication manager
-from .auth_manager import (
-    AuthCredentials,
-    AuthSource,
-    AuthType,
-    UnifiedAuthManager,
-    create_anthropic_client,
-    discover_credentials,
-    get_auth_status,
-)
-from .client import ClaudeClient, create_client
-
-# Import OAuth manager
-from .oauth_manager import (
-    OAuthTokenManager,
-    get_oauth_info,
-    get_oauth_token,
-    get_token_manager,
-    is_oauth_available,
-)
-
-# Import debug utilities
-from .debug import (
-    diagnose,
-    export_diagnostics,
-    get_diagnostics,
-)
-
-# Import validation utilities
-from .validate import (
-    validate_api_key,
-    validate_oauth_token,
-    validate_credential,
-    is_token_expired,
-    get_validation_hints,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Public names are resolved on first access (PEP 562), so importing the package
+# (e.g. for the CLI) only loads the submodules the caller actually uses
+_LAZY = {
+    # Main client
+    "ClaudeClient": ("client", "ClaudeClient"),
+    "create_client": ("client", "create_client"),
+    # Authentication manager
+    "AuthCredentials": ("auth_manager", "AuthCredentials"),
+    "AuthSource": ("auth_manager", "AuthSource"),
+    "AuthType": ("auth_manager", "AuthType"),
+    "UnifiedAuthManager": ("auth_manager", "UnifiedAuthManager"),
+    "create_anthropic_client": ("auth_manager", "create_anthropic_client"),
+    "discover_credentials": ("auth_manager", "discover_credentials"),
+    "get_auth_manager": ("auth_manager", "get_auth_manager"),
+    "get_auth_status": ("auth_manager", "get_auth_status"),
+    # OAuth manager
+    "OAuthTokenManager": ("oauth_manager", "OAuthTokenManager"),
+    "get_oauth_info": ("oauth_manager", "get_oauth_info"),
+    "get_oauth_token": ("oauth_manager", "get_oauth_token"),
+    "get_token_manager": ("oauth_manager", "get_token_manager"),
+    "is_oauth_available": ("oauth_manager", "is_oauth_available"),
+    # Debug utilities
+    "diagnose": ("debug", "diagnose"),
+    "export_diagnostics": ("debug", "export_diagnostics"),
+    "get_diagnostics": ("debug", "get_diagnostics"),
+    # Validation utilities
+    "validate_api_key": ("validate", "validate_api_key"),
+    "validate_oauth_token": ("validate", "validate_oauth_token"),
+    "validate_credential": ("validate", "validate_credential"),
+    "is_token_expired": ("validate", "is_token_expired"),
+    "get_validation_hints": ("validate", "get_validation_hints"),
+}
+
+if TYPE_CHECKING:
+    from .auth_manager import (
+        AuthCredentials,
+        AuthSource,
+        AuthType,
+        UnifiedAuthManager,
+        create_anthropic_client,
+        discover_credentials,
+        get_auth_manager,
+        get_auth_status,
+    )
+    from .client import ClaudeClient, create_client
+    from .debug import (
+        diagnose,
+        export_diagnostics,
+        get_diagnostics,
+    )
+    from .oauth_manager import (
+        OAuthTokenManager,
+        get_oauth_info,
+        get_oauth_token,
+        get_token_manager,
+        is_oauth_available,
+    )
+    from .validate import (
+        get_validation_hints,
+        is_token_expired,
+        validate_api_key,
+        validate_credential,
+        validate_oauth_token,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in dir() output."""
+    return sorted(set(globals()) | set(_LAZY))
 
 
 # Define public API
@@ -114,6 +162,7 @@ __all__ = [
     "diagnose",
     "discover_credentials",
     "export_diagnostics",
+    "get_auth_manager",
     "get_auth_status",
     "get_diagnostics",
     "get_oauth_info",
@@ -147,26 +196,29 @@ def get_package_info() -> dict:
         >>> print(f"Version: {info['version']}")
         >>> print(f"Features: {', '.join(info['features'])}")
     """
-    return {
-        "name": "claude-oauth-auth",
-        "version": __version__,
-        "author": __author__,
-        "license": __license__,
-        "description": "Simplified authentication for Anthropic Claude API with OAuth support",
-        "features": [
-            "OAuth token support from Claude Code",
-            "Automatic credential discovery",
-            "Support for API keys and OAuth tokens",
-            "Comprehensive authentication diagnostics",
-            "Zero-configuration setup",
-            "Enhanced error messages with actionable fixes",
-            "Built-in validation utilities",
-            "Command-line diagnostic tools",
-            "Troubleshooting script for support",
-        ],
-        "public_api": __all__,
-    }
+    return dict(_PACKAGE_INFO)
 
 
 # Add to public API
 __all__.extend(["get_package_info", "get_version"])
+
+# Built once; get_package_info() hands out shallow copies
+_PACKAGE_INFO: Dict[str, Any] = {
+    "name": "claude-oauth-auth",
+    "version": __version__,
+    "author": __author__,
+    "license": __license__,
+    "description": "Simplified authentication for Anthropic Claude API with OAuth support",
+    "features": [
+        "OAuth token support from Claude Code",
+        "Automatic credential discovery",
+        "Support for API keys and OAuth tokens",
+        "Comprehensive authentication diagnostics",
+        "Zero-configuration setup",
+        "Enhanced error messages with actionable fixes",
+        "Built-in validation utilities",
+        "Command-line diagnostic tools",
+        "Troubleshooting script for support",
+    ],
+    "public_api": __all__,
+}
@@ -34,14 +34,16 @@ Architecture:
     which the SDK client uses to initialize the correct authentication mode.
 """
 
-import configparser
-import json
+import functools
 import logging
 import os
+import re
+import threading
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 # Import the OAuth manager
 from .oauth_manager import get_token_manager
@@ -50,6 +52,117 @@ from .oauth_manager import get_token_manager
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Credential prefixes used to tell OAuth tokens and API keys apart
+_ANTHROPIC_PREFIX = "sk-ant-"
+_OAUTH_PREFIX = "sk-ant-oat"
+_API_KEY_PREFIX = "sk-ant-api"
+
+# [section] headers and api_key/auth_token/key/token = ... lines in an INI config
+_INI_LINE_RE = re.compile(
+    rb"^[ \t]*(?:\[([^\]\r\n]*)\]|(api_key|auth_token|key|token)[ \t]*[=:]([^\r\n]*))",
+    re.M | re.I,
+)
+_INI_SECTIONS = (b"default", b"anthropic", b"DEFAULT")
+_INI_KEYS = (b"api_key", b"auth_token", b"key", b"token")
+
+# ANTHROPIC_API_KEY=... / ANTHROPIC_AUTH_TOKEN=... lines in a .env file
+_ENV_RE = re.compile(rb'^[ \t]*ANTHROPIC_(?:API_KEY|AUTH_TOKEN)=[ \t]*["\']?([^"\'\r\n]*)', re.M)
+
+# Top-level (column 0) api_key: ... / auth_token: ... lines, for reading YAML
+# without PyYAML, and the simple scalar values the fast path understands:
+# "double" or 'single' quoted without escapes, or plain, with an optional comment
+_YAML_KV_RE = re.compile(r"^(api_key|auth_token)[ \t]*:(.*)$", re.M)
+_YAML_SCALAR_RE = re.compile(
+    r"""[ \t]*(?:"([^"\\]*)"|'([^']*)'|([^\s"'|>&*!{\[#%@`,?:-][^#]*?)|)[ \t]*(?:(?<=[ \t])#.*)?"""
+)
+_YAML_NULLS = frozenset({"", "~", "null", "Null", "NULL"})
+
+
+# Shown when discovery finds no credentials
+_SETUP_INSTRUCTIONS = """
+No Anthropic API credentials found. Please set up authentication using one of these methods:
+
+METHOD 1: Claude Code OAuth (RECOMMENDED - Uses Claude Max subscription)
+   What: Free API access if you have Claude Max/Pro subscription
+   How:
+     1. Install Claude Code: https://claude.com/claude-code
+     2. Run 'claude' in terminal and log in
+     3. Credentials saved to: ~/.claude/.credentials.json
+   Status: Run 'python -m claude_oauth_auth status' to check
+
+METHOD 2: API Key (Standard - Billed separately)
+   What: Direct API access with per-token billing
+   How:
+     a) Get API key: https://console.anthropic.com/settings/keys
+     b) Set environment variable:
+        export ANTHROPIC_API_KEY="sk-ant-api03-..."
+     c) Or create config file:
+        mkdir -p ~/.anthropic
+        echo 'sk-ant-api03-...' > ~/.anthropic/api_key
+   Status: Check with 'echo $ANTHROPIC_API_KEY'
+
+METHOD 3: Explicit Parameter (Quick testing)
+   What: Pass credentials directly in code
+   How:
+     from claude_oauth_auth import ClaudeClient
+     # With API key:
+     client = ClaudeClient(api_key="sk-ant-api03-...")
+     # Or with OAuth token:
+     client = ClaudeClient(auth_token="sk-ant-oat01-...")
+
+TROUBLESHOOTING:
+   - Run diagnostics: python -m claude_oauth_auth diagnose
+   - Check status: python -m claude_oauth_auth status
+   - Documentation: https://github.com/astoreyai/claude-oauth-auth
+   - Get help: https://github.com/astoreyai/claude-oauth-auth/issues
+""".strip()
+
+
+def _scan_yaml_scalars(text: str) -> Optional[Dict[str, str]]:
+    """
+    Read top-level api_key/auth_token scalars from YAML text without PyYAML.
+
+    Returns:
+        Mapping of key to non-null value, or None if any of those keys has a
+        value too complex for the scanner (block scalars, anchors, escapes, ...)
+    """
+    values: Dict[str, str] = {}
+    for key, raw in _YAML_KV_RE.findall(text):
+        scalar = _YAML_SCALAR_RE.fullmatch(raw)
+        if scalar is None:
+            return None
+
+        double_quoted, single_quoted, plain = scalar.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = "" if plain is None or plain in _YAML_NULLS else plain
+
+        # Like a YAML mapping, a repeated key keeps its last value
+        if value.strip():
+            values[key] = value.strip()
+        else:
+            values.pop(key, None)
+
+    return values
+
+
+def _list_files(directory: Path) -> FrozenSet[str]:
+    """
+    Return the names of regular files in a directory.
+
+    File types come from the directory listing itself, so only symlinks cost
+    an extra stat (they are followed, keeping symlinked dotfiles working).
+    Returns an empty set if the directory can't be listed.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
 
 class AuthType(Enum):
     """Types of authentication credentials."""
@@ -89,7 +202,9 @@ class AuthCredentials:
 
     def __repr__(self) -> str:
         """String representation with credential partially masked."""
-        masked_cred = self.credential[:15] + "..." + self.credential[-4:]
+        # Short (malformed) credentials would be shown almost whole, so hide them entirely
+        credential = self.credential
+        masked_cred = credential[:15] + "..." + credential[-4:] if len(credential) >= 24 else "***"
         return (
             f"AuthCredentials("
             f"type={self.auth_type.value}, "
@@ -98,6 +213,28 @@ class AuthCredentials:
         )
 
 
+# UnifiedAuthManager discovery cache key: explicit parameters and environment
+# variables, Claude Code credentials file mtime, config file mtimes
+_CacheKey = Tuple[Tuple[Optional[str], ...], Optional[int], Tuple[Optional[int], ...]]
+
+
+def _mtime(path: Any) -> Optional[int]:
+    """Modification time of path in nanoseconds, or None if it cannot be stat-ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _classify(token: str, default: AuthType) -> AuthType:
+    """Detect the credential type from its prefix, falling back to ``default``."""
+    if token.startswith(_OAUTH_PREFIX):
+        return AuthType.OAUTH_TOKEN
+    if token.startswith(_API_KEY_PREFIX):
+        return AuthType.API_KEY
+    return default
+
+
 class UnifiedAuthManager:
     """
     Manages authentication credential discovery and validation.
@@ -123,6 +260,36 @@ class UnifiedAuthManager:
         >>> print(status['summary'])
     """
 
+    # Sources that hold a credential string directly, in priority order; the
+    # values come from _credentials_cache_key(), which uses the same order:
+    # (auth type, source, metadata note, verbose log message)
+    _SIMPLE_SOURCES: Tuple[Tuple[AuthType, AuthSource, str, str], ...] = (
+        (
+            AuthType.OAUTH_TOKEN,
+            AuthSource.EXPLICIT_OAUTH,
+            "Explicit OAuth token provided to constructor",
+            "Using explicit auth_token parameter",
+        ),
+        (
+            AuthType.API_KEY,
+            AuthSource.EXPLICIT_API_KEY,
+            "Explicit API key provided to constructor",
+            "Using explicit api_key parameter",
+        ),
+        (
+            AuthType.OAUTH_TOKEN,
+            AuthSource.ENV_OAUTH,
+            "OAuth token from ANTHROPIC_AUTH_TOKEN env var",
+            "Using ANTHROPIC_AUTH_TOKEN environment variable",
+        ),
+        (
+            AuthType.API_KEY,
+            AuthSource.ENV_API_KEY,
+            "API key from ANTHROPIC_API_KEY env var",
+            "Using ANTHROPIC_API_KEY environment variable",
+        ),
+    )
+
     def __init__(
         self, api_key: Optional[str] = None, auth_token: Optional[str] = None, verbose: bool = False
     ):
@@ -133,6 +300,10 @@ class UnifiedAuthManager:
             api_key: Optional explicit API key (sk-ant-api03-...)
             auth_token: Optional explicit OAuth token (sk-ant-oat01-...)
             verbose: If True, log detailed authentication discovery info
+
+        Explicit credentials are still checked by prefix, so an OAuth token
+        passed as api_key (or an API key passed as auth_token) is used as the
+        type it actually is.
         """
         self.explicit_api_key = api_key
         self.explicit_auth_token = auth_token
@@ -145,6 +316,77 @@ class UnifiedAuthManager:
         # OAuth manager for Claude Code credentials
         self.oauth_manager = get_token_manager()
 
+        # Last discovered credentials and the inputs they were discovered from.
+        # Managers are shared between threads by get_auth_manager(), so the
+        # caches below are only read and written while holding this lock.
+        self._cache_lock = threading.RLock()
+        self._cached_credentials: Optional[AuthCredentials] = None
+        self._cache_key: Optional[_CacheKey] = None
+
+        # Claude Code token info, keyed by the credentials file's mtime
+        self._oauth_info_cache: Optional[Dict[str, Any]] = None
+        self._oauth_info_mtime: Optional[int] = None
+
+    def _credentials_cache_key(self) -> _CacheKey:
+        """
+        Inputs that change which credentials discovery returns.
+
+        Returns:
+            The explicit parameters and environment variables (in _SIMPLE_SOURCES
+            order), the Claude Code credentials file mtime, and the mtimes of
+            every config file in _config_locations() order
+        """
+        env = os.environ
+        simple_values = (
+            self.explicit_auth_token,
+            self.explicit_api_key,
+            env.get("ANTHROPIC_AUTH_TOKEN"),
+            env.get("ANTHROPIC_API_KEY"),
+        )
+        config_mtimes = tuple(
+            _mtime(directory / filename) for directory, filename, _ in self._config_locations()
+        )
+        return simple_values, self._credentials_file_mtime(), config_mtimes
+
+    def _credentials_file_mtime(self) -> Optional[int]:
+        """Modification time of the Claude Code credentials file, or None if missing."""
+        return _mtime(self.oauth_manager.credentials_path)
+
+    def _get_oauth_info_cached(self) -> Dict[str, Any]:
+        """
+        Get Claude Code token info, re-reading it only when the file changes.
+
+        The credentials file is stat-ed on each call and reloaded when its
+        modification time differs from the cached one. ``is_valid`` is
+        recomputed every time because expiry depends on the clock.
+        """
+        mtime = self._credentials_file_mtime()
+        with self._cache_lock:
+            if self._oauth_info_cache is None or mtime != self._oauth_info_mtime:
+                if self._oauth_info_cache is not None and mtime is not None:
+                    self.oauth_manager.reload()
+                self._oauth_info_cache = self.oauth_manager.get_token_info()
+                self._oauth_info_mtime = mtime
+
+            info = dict(self._oauth_info_cache)
+        if info.get("available"):
+            info["is_valid"] = datetime.now() < datetime.fromisoformat(info["expires_at"])
+        return info
+
+    def invalidate_cache(self) -> None:
+        """
+        Forget cached credentials so the next discovery re-checks every source.
+
+        Changes to explicit parameters, environment variables and the mtimes
+        of credential and config files are detected automatically; call this
+        when a file may have changed without its mtime moving.
+        """
+        with self._cache_lock:
+            self._cached_credentials = None
+            self._cache_key = None
+            self._oauth_info_cache = None
+            self._oauth_info_mtime = None
+
     def discover_credentials(self) -> AuthCredentials:
         """
         Discover authentication credentials using priority cascade.
@@ -157,6 +399,17 @@ class UnifiedAuthManager:
         5. Claude Code OAuth credentials (~/.claude/.credentials.json)
         6. Config files (~/.anthropic/config, etc.)
 
+        Every credential is typed by its prefix (sk-ant-oat... is OAuth,
+        sk-ant-api... is an API key), so a token passed as the "wrong"
+        parameter or variable still authenticates correctly. Unrecognised
+        prefixes keep the type implied by their source.
+
+        The result is cached on the manager and reused until an explicit
+        parameter or environment variable changes, the Claude Code credentials
+        file or any config file is modified, the cached Claude Code token
+        expires, or invalidate_cache() is called. Checking the cache costs one
+        stat() per credential and config file.
+
         Returns:
             AuthCredentials with discovered credential
 
@@ -169,61 +422,67 @@ class UnifiedAuthManager:
             >>> if creds.auth_type == AuthType.OAUTH_TOKEN:
             ...     print("Using Claude Max subscription!")
         """
-        # Priority 1: Explicit auth_token parameter (OAuth)
-        if self.explicit_auth_token and self.explicit_auth_token.strip():
-            if self.verbose:
-                logger.info("Using explicit auth_token parameter")
-
-            return AuthCredentials(
-                credential=self.explicit_auth_token,
-                auth_type=AuthType.OAUTH_TOKEN,
-                source=AuthSource.EXPLICIT_OAUTH,
-                metadata={"note": "Explicit OAuth token provided to constructor"},
-            )
-
-        # Priority 2: Explicit api_key parameter (API key)
-        if self.explicit_api_key and self.explicit_api_key.strip():
-            if self.verbose:
-                logger.info("Using explicit api_key parameter")
-
-            return AuthCredentials(
-                credential=self.explicit_api_key,
-                auth_type=AuthType.API_KEY,
-                source=AuthSource.EXPLICIT_API_KEY,
-                metadata={"note": "Explicit API key provided to constructor"},
-            )
-
-        # Priority 3: ANTHROPIC_AUTH_TOKEN environment variable (OAuth)
-        env_oauth_token = os.getenv("ANTHROPIC_AUTH_TOKEN")
-        if env_oauth_token and env_oauth_token.strip():
-            if self.verbose:
-                logger.info("Using ANTHROPIC_AUTH_TOKEN environment variable")
+        cache_key = self._credentials_cache_key()
+        with self._cache_lock:
+            cached = self._cached_credentials
+            if (
+                cached is not None
+                and cache_key == self._cache_key
+                and (
+                    cached.source != AuthSource.CLAUDE_CODE_OAUTH
+                    or not self.oauth_manager.is_token_expired()
+                )
+            ):
+                return cached
+
+            previous_key = self._cache_key
+            if previous_key is not None and cache_key[1] not in (None, previous_key[1]):
+                # Claude Code rewrote its credentials (e.g. a token refresh)
+                self.oauth_manager.reload()
+
+            credentials = self._discover_credentials_uncached(cache_key[0])
+            self._cached_credentials = credentials
+            self._cache_key = cache_key
+            return credentials
+
+    def _discover_credentials_uncached(
+        self, simple_values: Tuple[Optional[str], ...]
+    ) -> AuthCredentials:
+        """
+        Run the full priority cascade without consulting the cache.
 
-            return AuthCredentials(
-                credential=env_oauth_token,
-                auth_type=AuthType.OAUTH_TOKEN,
-                source=AuthSource.ENV_OAUTH,
-                metadata={"note": "OAuth token from ANTHROPIC_AUTH_TOKEN env var"},
-            )
+        Args:
+            simple_values: Explicit parameters and environment variables, as
+                returned by _credentials_cache_key()
+        """
+        # Priorities 1-4: explicit parameters, then environment variables
+        for value, (auth_type, source, note, log_message) in zip(
+            simple_values, self._SIMPLE_SOURCES
+        ):
+            if value and value.strip():
+                # Parameters and variables are easy to mix up; trust the token prefix
+                detected_type = _classify(value, auth_type)
+                if detected_type is not auth_type and self.verbose:
+                    logger.warning(
+                        f"Credential from {source.value} looks like {detected_type.value}, "
+                        f"not {auth_type.value}; using it as {detected_type.value}"
+                    )
 
-        # Priority 4: ANTHROPIC_API_KEY environment variable (API key)
-        env_api_key = os.getenv("ANTHROPIC_API_KEY")
-        if env_api_key and env_api_key.strip():
-            if self.verbose:
-                logger.info("Using ANTHROPIC_API_KEY environment variable")
+                if self.verbose:
+                    logger.info(log_message)
 
-            return AuthCredentials(
-                credential=env_api_key,
-                auth_type=AuthType.API_KEY,
-                source=AuthSource.ENV_API_KEY,
-                metadata={"note": "API key from ANTHROPIC_API_KEY env var"},
-            )
+                return AuthCredentials(
+                    credential=value,
+                    auth_type=detected_type,
+                    source=source,
+                    metadata={"note": note},
+                )
 
         # Priority 5: Claude Code OAuth credentials
         oauth_token = self.oauth_manager.get_access_token()
         if oauth_token:
+            oauth_info = self.oauth_manager.get_token_info()
             if self.verbose:
-                oauth_info = self.oauth_manager.get_token_info()
                 logger.info(
                     f"Using Claude Code OAuth credentials "
                     f"(subscription: {oauth_info.get('subscription_type')})"
@@ -233,7 +492,7 @@ class UnifiedAuthManager:
                 credential=oauth_token,
                 auth_type=AuthType.OAUTH_TOKEN,
                 source=AuthSource.CLAUDE_CODE_OAUTH,
-                metadata=self.oauth_manager.get_token_info(),
+                metadata=oauth_info,
             )
 
         # Priority 6: Config files
@@ -261,30 +520,23 @@ class UnifiedAuthManager:
         Returns:
             AuthCredentials if found, None otherwise
         """
-        config_locations = [
-            (Path.home() / ".anthropic" / "config", self._read_ini_config),
-            (Path.home() / ".anthropic" / "config.json", self._read_json_config),
-            (Path.home() / ".anthropic" / "api_key", self._read_plain_text_config),
-            (Path.home() / ".config" / "anthropic" / "config", self._read_ini_config),
-            (Path("config") / "credentials.yaml", self._read_yaml_config),
-            (Path(".env"), self._read_env_file),
-        ]
+        # List each directory once instead of stat-ing every candidate path;
+        # directories and other non-files never reach a reader
+        listings: Dict[Path, FrozenSet[str]] = {}
+
+        for directory, filename, reader in self._config_locations():
+            names = listings.get(directory)
+            if names is None:
+                names = listings[directory] = _list_files(directory)
 
-        for config_path, reader in config_locations:
-            if config_path.exists():
+            if filename in names:
+                config_path = directory / filename
                 try:
                     credential = reader(config_path)
                     if credential:
-                        # Determine if it's an API key or OAuth token
-                        auth_type = (
-                            AuthType.OAUTH_TOKEN
-                            if credential.startswith("sk-ant-oat")
-                            else AuthType.API_KEY
-                        )
-
                         return AuthCredentials(
                             credential=credential,
-                            auth_type=auth_type,
+                            auth_type=_classify(credential, AuthType.API_KEY),
                             source=AuthSource.CONFIG_FILE,
                             metadata={"file": str(config_path), "format": reader.__name__},
                         )
@@ -297,22 +549,50 @@ class UnifiedAuthManager:
 
         return None
 
+    def _config_locations(
+        self,
+    ) -> List[Tuple[Path, str, Callable[[Path], Optional[str]]]]:
+        """Config file locations as (directory, filename, reader), in priority order."""
+        home = Path.home()
+        anthropic_dir = home / ".anthropic"
+        return [
+            (anthropic_dir, "config", self._read_ini_config),
+            (anthropic_dir, "config.json", self._read_json_config),
+            (anthropic_dir, "api_key", self._read_plain_text_config),
+            (home / ".config" / "anthropic", "config", self._read_ini_config),
+            (Path("config"), "credentials.yaml", self._read_yaml_config),
+            (Path("."), ".env", self._read_env_file),
+        ]
+
     def _read_ini_config(self, path: Path) -> Optional[str]:
         """Read API key from INI config file."""
-        config = configparser.ConfigParser()
-        config.read(path)
-
-        # Try multiple key names
-        for section in ["default", "anthropic", "DEFAULT"]:
-            if section in config:
-                for key in ["api_key", "auth_token", "key", "token"]:
-                    if key in config[section]:
-                        return config[section][key].strip()
+        # Collect the candidate keys of each section (keys are case-insensitive,
+        # as in configparser); lines before the first header belong to none
+        sections: Dict[bytes, Dict[bytes, bytes]] = {}
+        current: Optional[Dict[bytes, bytes]] = None
+        for header, key, value in _INI_LINE_RE.findall(path.read_bytes()):
+            if key:
+                if current is not None:
+                    current[key.lower()] = value
+            else:
+                current = sections.setdefault(header.strip(), {})
+
+        # Try sections, then key names, in priority order; like configparser,
+        # every section falls back to values from [DEFAULT]
+        defaults = sections.get(b"DEFAULT", {})
+        for section in _INI_SECTIONS:
+            if section in sections:
+                values = {**defaults, **sections[section]}
+                for key in _INI_KEYS:
+                    if key in values:
+                        return values[key].decode().strip().strip("\"'")
 
         return None
 
     def _read_json_config(self, path: Path) -> Optional[str]:
         """Read API key from JSON config file."""
+        import json
+
         with open(path) as f:
             data = json.load(f)
 
@@ -333,90 +613,47 @@ class UnifiedAuthManager:
             content = f.read().strip()
 
         # Return if it looks like a valid key
-        if content.startswith("sk-ant-"):
+        if content.startswith(_ANTHROPIC_PREFIX):
             return content
 
         return None
 
     def _read_yaml_config(self, path: Path) -> Optional[str]:
         """Read API key from YAML config file (basic parsing)."""
+        # Simple top-level api_key/auth_token scalars cover the common case
+        # without PyYAML; anything else goes through yaml.safe_load
+        text = path.read_text(encoding="utf-8")
+        simple = _scan_yaml_scalars(text)
+        if simple:
+            return simple.get("api_key") or simple["auth_token"]
+
         try:
             import yaml
+        except ImportError:
+            return None
 
-            with open(path) as f:
-                data = yaml.safe_load(f)
+        data = yaml.safe_load(text)
+        if not isinstance(data, dict):
+            return None
 
-            for key in ["api_key", "auth_token", "ANTHROPIC_API_KEY"]:
-                if key in data:
-                    value = data[key]
-                    # Type annotation: ensure we return Optional[str]
-                    if value is None or (isinstance(value, str) and not value.strip()):
-                        continue
-                    return str(value).strip()
-        except ImportError:
-            # Fall back to simple parsing if PyYAML not available
-            with open(path) as f:
-                for line in f:
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        if key.strip() in ["api_key", "auth_token"]:
-                            stripped = value.strip().strip('"').strip("'")
-                            if stripped:
-                                return stripped
+        for key in ["api_key", "auth_token", "ANTHROPIC_API_KEY"]:
+            if key in data:
+                value = data[key]
+                # Type annotation: ensure we return Optional[str]
+                if value is None or (isinstance(value, str) and not value.strip()):
+                    continue
+                return str(value).strip()
 
         return None
 
     def _read_env_file(self, path: Path) -> Optional[str]:
         """Read API key from .env file."""
-        with open(path) as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("ANTHROPIC_API_KEY=") or line.startswith(
-                    "ANTHROPIC_AUTH_TOKEN="
-                ):
-                    return line.split("=", 1)[1].strip().strip('"').strip("'")
-
-        return None
+        match = _ENV_RE.search(path.read_bytes())
+        return match.group(1).decode().strip() if match else None
 
     def _get_setup_instructions(self) -> str:
         """Get helpful setup instructions when no credentials are found."""
-        return """
-No Anthropic API credentials found. Please set up authentication using one of these methods:
-
-METHOD 1: Claude Code OAuth (RECOMMENDED - Uses Claude Max subscription)
-   What: Free API access if you have Claude Max/Pro subscription
-   How:
-     1. Install Claude Code: https://claude.com/claude-code
-     2. Run 'claude' in terminal and log in
-     3. Credentials saved to: ~/.claude/.credentials.json
-   Status: Run 'python -m claude_oauth_auth status' to check
-
-METHOD 2: API Key (Standard - Billed separately)
-   What: Direct API access with per-token billing
-   How:
-     a) Get API key: https://console.anthropic.com/settings/keys
-     b) Set environment variable:
-        export ANTHROPIC_API_KEY="sk-ant-api03-..."
-     c) Or create config file:
-        mkdir -p ~/.anthropic
-        echo 'sk-ant-api03-...' > ~/.anthropic/api_key
-   Status: Check with 'echo $ANTHROPIC_API_KEY'
-
-METHOD 3: Explicit Parameter (Quick testing)
-   What: Pass credentials directly in code
-   How:
-     from claude_oauth_auth import ClaudeClient
-     # With API key:
-     client = ClaudeClient(api_key="sk-ant-api03-...")
-     # Or with OAuth token:
-     client = ClaudeClient(auth_token="sk-ant-oat01-...")
-
-TROUBLESHOOTING:
-   - Run diagnostics: python -m claude_oauth_auth diagnose
-   - Check status: python -m claude_oauth_auth status
-   - Documentation: https://github.com/astoreyai/claude-oauth-auth
-   - Get help: https://github.com/astoreyai/claude-oauth-auth/issues
-        """.strip()
+        return _SETUP_INSTRUCTIONS
 
     def is_oauth_available(self) -> bool:
         """
@@ -428,10 +665,10 @@ TROUBLESHOOTING:
         if self.explicit_auth_token:
             return True
 
-        if os.getenv("ANTHROPIC_AUTH_TOKEN"):
+        if os.environ.get("ANTHROPIC_AUTH_TOKEN"):
             return True
 
-        return self.oauth_manager.is_oauth_available() and not self.oauth_manager.is_token_expired()
+        return bool(self._get_oauth_info_cached().get("is_valid"))
 
     def is_api_key_available(self) -> bool:
         """
@@ -443,7 +680,7 @@ TROUBLESHOOTING:
         if self.explicit_api_key:
             return True
 
-        if os.getenv("ANTHROPIC_API_KEY"):
+        if os.environ.get("ANTHROPIC_API_KEY"):
             return True
 
         # Check config files
@@ -463,6 +700,7 @@ TROUBLESHOOTING:
             >>> for method in status['available_methods']:
             ...     print(f"  - {method}")
         """
+        creds: Optional[AuthCredentials]
         try:
             creds = self.discover_credentials()
             auth_type = creds.auth_type.value
@@ -470,11 +708,25 @@ TROUBLESHOOTING:
             is_valid = True
             error = None
         except ValueError as e:
+            creds = None
             auth_type = None
             source = None
             is_valid = False
             error = str(e)
 
+        # Gather every source's state once, then derive the report from it
+        env = os.environ
+        env_api_key = env.get("ANTHROPIC_API_KEY")
+        env_auth_token = env.get("ANTHROPIC_AUTH_TOKEN")
+
+        token_info = self._get_oauth_info_cached()
+        oauth_available = bool(token_info.get("available"))
+
+        if creds is not None and creds.source == AuthSource.CONFIG_FILE:
+            config_cred: Optional[AuthCredentials] = creds
+        else:
+            config_cred = self._discover_from_config_files()
+
         # Check what methods are available
         available_methods = []
 
@@ -482,22 +734,20 @@ TROUBLESHOOTING:
             available_methods.append("explicit_api_key")
         if self.explicit_auth_token:
             available_methods.append("explicit_auth_token")
-        if os.getenv("ANTHROPIC_API_KEY"):
+        if env_api_key:
             available_methods.append("ANTHROPIC_API_KEY_env_var")
-        if os.getenv("ANTHROPIC_AUTH_TOKEN"):
+        if env_auth_token:
             available_methods.append("ANTHROPIC_AUTH_TOKEN_env_var")
-        if self.oauth_manager.is_oauth_available():
-            if self.oauth_manager.is_token_expired():
-                available_methods.append("claude_code_oauth_EXPIRED")
-            else:
+        if oauth_available:
+            if token_info.get("is_valid"):
                 available_methods.append("claude_code_oauth")
-        if self._discover_from_config_files():
+            else:
+                available_methods.append("claude_code_oauth_EXPIRED")
+        if config_cred:
             available_methods.append("config_file")
 
         # OAuth token info if available
-        oauth_info = None
-        if self.oauth_manager.is_oauth_available():
-            oauth_info = self.oauth_manager.get_token_info()
+        oauth_info = token_info if oauth_available else None
 
         summary = (
             f"Authentication: {'Valid' if is_valid else 'No credentials found'}\n"
@@ -560,8 +810,44 @@ TROUBLESHOOTING:
 # Convenience functions for simple usage
 
 
+@functools.lru_cache(maxsize=16)
+def get_auth_manager(
+    api_key: Optional[str] = None, auth_token: Optional[str] = None, verbose: bool = False
+) -> UnifiedAuthManager:
+    """
+    Get the shared authentication manager for a set of explicit parameters.
+
+    Managers are kept per (api_key, auth_token, verbose), so the CLI, the
+    convenience functions and ClaudeClient reuse one discovery cache instead
+    of walking every credential source again.
+
+    Args:
+        api_key: Optional explicit API key
+        auth_token: Optional explicit OAuth token
+        verbose: If True, log detailed authentication discovery info
+
+    Returns:
+        UnifiedAuthManager instance
+
+    Example:
+        >>> from claude_oauth_auth.auth_manager import get_auth_manager
+        >>> creds = get_auth_manager().discover_credentials()
+    """
+    return UnifiedAuthManager(api_key=api_key, auth_token=auth_token, verbose=verbose)
+
+
+def reset_manager_cache() -> None:
+    """
+    Drop the shared managers returned by get_auth_manager().
+
+    The next convenience call starts with empty caches, which is useful in
+    tests that change config files or Claude Code credentials on disk.
+    """
+    get_auth_manager.cache_clear()
+
+
 def discover_credentials(
-    api_key: Optional[str] = None, auth_token: Optional[str] = None
+    api_key: Optional[str] = None, auth_token: Optional[str] = None, verbose: bool = False
 ) -> AuthCredentials:
     """
     Convenience function to discover credentials.
@@ -569,6 +855,7 @@ def discover_credentials(
     Args:
         api_key: Optional explicit API key
         auth_token: Optional explicit OAuth token
+        verbose: If True, log detailed authentication discovery info
 
     Returns:
         AuthCredentials with discovered credential
@@ -578,8 +865,7 @@ def discover_credentials(
         >>> creds = discover_credentials()
         >>> print(f"Found {creds.auth_type.value} from {creds.source.value}")
     """
-    manager = UnifiedAuthManager(api_key=api_key, auth_token=auth_token)
-    return manager.discover_credentials()
+    return get_auth_manager(api_key, auth_token, verbose).discover_credentials()
 
 
 def get_auth_status(
@@ -600,8 +886,7 @@ def get_auth_status(
         >>> status = get_auth_status()
         >>> print(status['summary'])
     """
-    manager = UnifiedAuthManager(api_key=api_key, auth_token=auth_token, verbose=True)
-    return manager.get_auth_status()
+    return get_auth_manager(api_key, auth_token, verbose=True).get_auth_status()
 
 
 def create_anthropic_client(**kwargs: Any) -> Any:
@@ -623,5 +908,4 @@ def create_anthropic_client(**kwargs: Any) -> Any:
         ...     messages=[{"role": "user", "content": "Hello!"}]
         ... )
     """
-    manager = UnifiedAuthManager()
-    return manager.create_anthropic_client(**kwargs)
+    return get_auth_manager().create_anthropic_client(**kwargs)
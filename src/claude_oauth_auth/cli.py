@@ -34,10 +34,7 @@ import argparse
 import sys
 from typing import List, Optional
 
-from .auth_manager import get_auth_status
-from .debug import diagnose, export_diagnostics, get_diagnostics
-from .oauth_manager import get_oauth_info, is_oauth_available
-from .validate import validate_credential
+# Each command imports what it needs, so '--help' or a bad argument only loads argparse
 
 
 def cmd_status(args: argparse.Namespace) -> int:
@@ -50,6 +47,8 @@ def cmd_status(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    from .auth_manager import get_auth_status
+
     print("Authentication Status")
     print("=" * 80)
     print()
@@ -113,12 +112,12 @@ def cmd_test(args: argparse.Namespace) -> int:
     print()
 
     try:
-        from .auth_manager import UnifiedAuthManager
+        from .auth_manager import discover_credentials
+        from .validate import validate_credential
         from anthropic import Anthropic
 
         # Try to discover and use credentials
-        manager = UnifiedAuthManager(verbose=args.verbose)
-        creds = manager.discover_credentials()
+        creds = discover_credentials(verbose=args.verbose)
 
         print(f"Using: {creds.auth_type.value} from {creds.source.value}")
 
@@ -173,6 +172,8 @@ def cmd_diagnose(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    from .debug import diagnose
+
     try:
         report = diagnose(
             verbose=args.verbose,
@@ -203,6 +204,8 @@ def cmd_config(args: argparse.Namespace) -> int:
     from pathlib import Path
     import os
 
+    from .oauth_manager import get_oauth_info, is_oauth_available
+
     # Show credential sources
     print("Credential Sources (in priority order):")
     print()
@@ -255,6 +258,8 @@ def cmd_export(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    from .debug import export_diagnostics
+
     try:
         filepath = export_diagnostics(
             output_file=args.output,
@@ -282,6 +287,8 @@ def cmd_validate(args: argparse.Namespace) -> int:
     print("=" * 80)
     print()
 
+    from .validate import validate_credential
+
     credential = args.credential
 
     is_valid, message, cred_type = validate_credential(credential)
@@ -43,17 +43,50 @@ Architecture:
     - Anthropic(api_key=...) for API keys (standard billing)
 """
 
+import asyncio
+import atexit
+import importlib.util
 import logging
-from typing import Any, Dict, Optional
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-from anthropic import Anthropic
+from .auth_manager import AuthCredentials, AuthType, get_auth_manager
 
-from .auth_manager import AuthCredentials, AuthType, UnifiedAuthManager
+
+if TYPE_CHECKING:
+    # The SDK itself is imported when the first client is created, so importing
+    # this module (e.g. for the CLI) doesn't pay for httpx, pydantic, etc.
+    from anthropic import Anthropic, AsyncAnthropic
 
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# HTTP/2 (opt-in via ClaudeClient(http2=True)) needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Retries the SDK makes on connection errors, 408/409/429 and 5xx responses
+# (including 529 overloaded), with jittered exponential backoff that honours
+# Retry-After. Applies to every call: generate, chat, stream and async.
+MAX_RETRIES = 4
+
+# (HTTP client, Anthropic client) pairs shared by every ClaudeClient with the
+# same credentials, so short-lived clients reuse warm TLS connections
+_CLIENT_CACHE: Dict[Tuple[AuthType, str, bool], Tuple[Any, "Anthropic"]] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _close_cached_clients() -> None:
+    """Close the pooled connections of every shared Anthropic client."""
+    with _client_cache_lock:
+        for _, client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+
+
+atexit.register(_close_cached_clients)
+
 
 class ClaudeClient:
     """
@@ -98,6 +131,7 @@ class ClaudeClient:
         temperature: float = 0.7,
         max_tokens: int = 4096,
         verbose: bool = False,
+        http2: bool = False,
     ):
         """
         Initialize Claude client with enhanced authentication.
@@ -123,8 +157,13 @@ class ClaudeClient:
             verbose: If True, logs authentication discovery details.
                     Useful for debugging credential issues.
 
+            http2: If True, talk to the API over HTTP/2, multiplexing requests
+                  on one connection. Requires the h2 package
+                  (pip install claude-oauth-auth[http2]). Default HTTP/1.1.
+
         Raises:
             ValueError: If no credentials can be discovered from any source.
+            ImportError: If http2 is True but h2 is not installed.
 
         Example:
             >>> # Auto-discovery (tries OAuth, then API key, then config)
@@ -144,10 +183,15 @@ class ClaudeClient:
         self.max_tokens = max_tokens
         self.verbose = verbose
 
-        # Create authentication manager
-        self.auth_manager = UnifiedAuthManager(
-            api_key=api_key, auth_token=auth_token, verbose=verbose
-        )
+        if http2 and not HTTP2_AVAILABLE:
+            raise ImportError(
+                "HTTP/2 support requires the h2 package.\n"
+                "Install it with: pip install claude-oauth-auth[http2]"
+            )
+        self.http2 = http2
+
+        # Shared authentication manager, so clients reuse one discovery cache
+        self.auth_manager = get_auth_manager(api_key, auth_token, verbose)
 
         # Discover credentials using unified manager
         try:
@@ -170,13 +214,55 @@ class ClaudeClient:
             )
             raise ValueError(error_msg) from e
 
-        # Create Anthropic client based on credential type
-        self.client = self._create_anthropic_client()
+        # Anthropic client and its pooled HTTPS client, shared with every
+        # ClaudeClient that uses the same credentials
+        self.http_client, self.client = self._get_shared_client()
+
+        # Async clients, created on first use in each event loop: an SDK async
+        # client's connection pool is bound to the loop that first used it
+        self._async_clients: "weakref.WeakKeyDictionary[Any, AsyncAnthropic]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_clients_lock = threading.Lock()
 
         if verbose:
             logger.info(f"Initialized ClaudeClient with {self.model}")
 
-    def _create_anthropic_client(self) -> Anthropic:
+    def _get_shared_client(self, replace: bool = False) -> Tuple[Any, "Anthropic"]:
+        """
+        Get the HTTP and Anthropic clients for these credentials from the shared cache.
+
+        Args:
+            replace: If True, build new clients even if cached ones exist
+
+        Returns:
+            Tuple of (HTTP client, Anthropic client)
+        """
+        key = (self.credentials.auth_type, self.credentials.credential, self.http2)
+        with _client_cache_lock:
+            entry = None if replace else _CLIENT_CACHE.get(key)
+            if entry is None:
+                self.http_client = self._create_http_client()
+                entry = _CLIENT_CACHE[key] = (self.http_client, self._create_anthropic_client())
+        return entry
+
+    def _create_http_client(self) -> Any:
+        """
+        Create the pooled keep-alive HTTP client used by the Anthropic SDK.
+
+        Returns:
+            SDK DefaultHttpxClient (HTTP/2 if requested), or None on SDK
+            versions without it, letting the SDK create its own pooled client
+        """
+        try:
+            # Built on whichever httpx package this SDK release uses, with the SDK's
+            # own timeout, connection-pool and TCP keep-alive defaults
+            from anthropic import DefaultHttpxClient
+        except ImportError:  # anthropic < 0.26: the SDK builds its own pooled client
+            return None
+        return DefaultHttpxClient(http2=self.http2)
+
+    def _create_anthropic_client(self) -> "Anthropic":
         """
         Create Anthropic SDK client with appropriate authentication.
 
@@ -187,16 +273,78 @@ class ClaudeClient:
         Returns:
             Configured Anthropic client instance
         """
+        from anthropic import Anthropic
+
         if self.credentials.auth_type == AuthType.OAUTH_TOKEN:
             # Use OAuth token (Claude Max subscription)
             if self.verbose:
                 logger.info("Creating Anthropic client with OAuth authentication")
-            return Anthropic(auth_token=self.credentials.credential)
+            return Anthropic(
+                auth_token=self.credentials.credential,
+                http_client=self.http_client,
+                max_retries=MAX_RETRIES,
+            )
         else:
             # Use API key (standard billing)
             if self.verbose:
                 logger.info("Creating Anthropic client with API key authentication")
-            return Anthropic(api_key=self.credentials.credential)
+            return Anthropic(
+                api_key=self.credentials.credential,
+                http_client=self.http_client,
+                max_retries=MAX_RETRIES,
+            )
+
+    def _create_async_anthropic_client(self) -> "AsyncAnthropic":
+        """
+        Create async Anthropic SDK client with the same credentials.
+
+        Returns:
+            Configured AsyncAnthropic client instance
+        """
+        from anthropic import AsyncAnthropic
+
+        if self.credentials.auth_type == AuthType.OAUTH_TOKEN:
+            return AsyncAnthropic(auth_token=self.credentials.credential, max_retries=MAX_RETRIES)
+        return AsyncAnthropic(api_key=self.credentials.credential, max_retries=MAX_RETRIES)
+
+    def _get_async_client(self) -> "AsyncAnthropic":
+        """
+        Get the async Anthropic client for the running event loop.
+
+        Returns:
+            AsyncAnthropic client created for (and only used in) this loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = self._create_async_anthropic_client()
+        return client
+
+    def _build_params(self, messages: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        """
+        Build Messages API parameters from messages and optional overrides.
+
+        Args:
+            messages: Messages API conversation (role/content dicts)
+            **kwargs: Optional overrides (temperature, max_tokens, model, system)
+
+        Returns:
+            Keyword arguments for messages.create / messages.stream
+        """
+        params: Dict[str, Any] = {
+            "model": kwargs.get("model", self.model),
+            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+            "temperature": kwargs.get("temperature", self.temperature),
+            "messages": messages,
+        }
+
+        # Add system prompt if provided
+        system_prompt = kwargs.get("system")
+        if system_prompt:
+            params["system"] = system_prompt
+
+        return params
 
     def generate(self, prompt: str, **kwargs: Any) -> str:
         """
@@ -215,7 +363,8 @@ class ClaudeClient:
             Generated text as string
 
         Raises:
-            RuntimeError: If the Claude API call fails
+            RuntimeError: If the Claude API call fails (after MAX_RETRIES
+                retries of rate limits, server errors and connection errors)
 
         Example:
             >>> client = ClaudeClient()
@@ -238,24 +387,9 @@ class ClaudeClient:
             ... )
         """
         # Override defaults with kwargs
-        temperature = kwargs.get("temperature", self.temperature)
-        max_tokens = kwargs.get("max_tokens", self.max_tokens)
-        model = kwargs.get("model", self.model)
-        system_prompt = kwargs.get("system")
+        params = self._build_params([{"role": "user", "content": prompt}], **kwargs)
 
         try:
-            # Build message parameters
-            params: Dict[str, Any] = {
-                "model": model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": [{"role": "user", "content": prompt}],
-            }
-
-            # Add system prompt if provided
-            if system_prompt:
-                params["system"] = system_prompt
-
             # Make API call to Claude
             response = self.client.messages.create(**params)
 
@@ -266,79 +400,298 @@ class ClaudeClient:
             return str(text)
 
         except Exception as e:
-            # Build helpful error message
-            error_details = (
-                f"❌ Claude API Call Failed\n\n"
-                f"Error: {e}\n\n"
-                f"Request Details:\n"
-                f"  - Model: {model}\n"
-                f"  - Prompt length: {len(prompt)} characters\n"
-                f"  - Temperature: {temperature}\n"
-                f"  - Max tokens: {max_tokens}\n\n"
-                f"Authentication:\n"
-                f"  - Type: {self.credentials.auth_type.value}\n"
-                f"  - Source: {self.credentials.source.value}\n\n"
-            )
+            raise RuntimeError(self._format_api_error(e, len(prompt), params)) from e
 
-            # Add specific help based on error type
-            error_str = str(e).lower()
-
-            if "authentication" in error_str or "api key" in error_str or "401" in error_str:
-                error_details += (
-                    "Possible Causes:\n"
-                    "  - Invalid or expired credentials\n"
-                    "  - OAuth token expired (if using Claude Code)\n\n"
-                    "How to Fix:\n"
-                    "  1. Check credentials: python -m claude_oauth_auth status\n"
-                    "  2. If using OAuth: Run 'claude' and log in again\n"
-                    "  3. If using API key: Verify key at https://console.anthropic.com/settings/keys\n"
-                )
-            elif "rate limit" in error_str or "429" in error_str:
-                error_details += (
-                    "Rate Limit Exceeded:\n"
-                    "  - You've made too many requests too quickly\n\n"
-                    "How to Fix:\n"
-                    "  1. Wait a few minutes before retrying\n"
-                    "  2. Implement exponential backoff in your code\n"
-                    "  3. Consider upgrading your API tier\n"
-                )
-            elif "quota" in error_str or "insufficient" in error_str:
-                error_details += (
-                    "Quota/Credit Issue:\n"
-                    "  - Insufficient API credits or quota exceeded\n\n"
-                    "How to Fix:\n"
-                    "  1. Check your account balance: https://console.anthropic.com/\n"
-                    "  2. Add credits to your account\n"
-                    "  3. Or use Claude Code OAuth with Max subscription\n"
-                )
-            elif "model" in error_str or "404" in error_str:
-                error_details += (
-                    "Model Issue:\n"
-                    "  - Model may not exist or you don't have access\n\n"
-                    "How to Fix:\n"
-                    "  1. Verify model name is correct\n"
-                    "  2. Check available models: https://docs.anthropic.com/models\n"
-                    "  3. Ensure your account has access to this model\n"
-                )
-            elif "timeout" in error_str or "connection" in error_str:
-                error_details += (
-                    "Connection Issue:\n"
-                    "  - Network timeout or connection error\n\n"
-                    "How to Fix:\n"
-                    "  1. Check your internet connection\n"
-                    "  2. Retry the request\n"
-                    "  3. Check Anthropic status: https://status.anthropic.com/\n"
-                )
-            else:
-                error_details += (
-                    "Troubleshooting:\n"
-                    "  1. Run diagnostics: python -m claude_oauth_auth diagnose\n"
-                    "  2. Check Anthropic status: https://status.anthropic.com/\n"
-                    "  3. Review API docs: https://docs.anthropic.com/\n"
-                    "  4. Get help: https://github.com/astoreyai/claude-oauth-auth/issues\n"
-                )
+    async def agenerate(self, prompt: str, **kwargs: Any) -> str:
+        """
+        Generate text using Claude API without blocking the event loop.
+
+        Async counterpart of generate(); gather several calls to run them
+        concurrently over the async client's shared connection pool.
+
+        Args:
+            prompt: The prompt to send to Claude
+
+            **kwargs: Same optional overrides as generate()
+
+        Returns:
+            Generated text as string
+
+        Raises:
+            RuntimeError: If the Claude API call fails
+
+        Example:
+            >>> client = ClaudeClient()
+            >>> answers = await asyncio.gather(
+            ...     client.agenerate("What is OAuth?"),
+            ...     client.agenerate("What is an API key?"),
+            ... )
+        """
+        return await self._agenerate_with(self._get_async_client(), prompt, **kwargs)
+
+    async def _agenerate_with(self, client: "AsyncAnthropic", prompt: str, **kwargs: Any) -> str:
+        """
+        Generate text for one prompt with the given async SDK client.
+
+        Args:
+            client: AsyncAnthropic client to send the request with
+            prompt: The prompt to send to Claude
+            **kwargs: Same optional overrides as generate()
+
+        Returns:
+            Generated text as string
+        """
+        params = self._build_params([{"role": "user", "content": prompt}], **kwargs)
+
+        try:
+            response = await client.messages.create(**params)
+            return str(response.content[0].text)
+
+        except Exception as e:
+            raise RuntimeError(self._format_api_error(e, len(prompt), params)) from e
+
+    def generate_many(self, prompts: List[str], concurrency: int = 8, **kwargs: Any) -> List[str]:
+        """
+        Generate text for several prompts concurrently.
+
+        Runs the requests on a private event loop with at most ``concurrency``
+        in flight, so N prompts take roughly N / concurrency round-trips
+        instead of N. Call agenerate() with asyncio.gather instead when
+        already inside an event loop.
+
+        Args:
+            prompts: Prompts to send to Claude
+
+            concurrency: Maximum number of requests in flight at once
 
-            raise RuntimeError(error_details) from e
+            **kwargs: Same optional overrides as generate(), applied to every prompt
+
+        Returns:
+            Generated texts, in the same order as ``prompts``
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            RuntimeError: If any Claude API call fails
+
+        Example:
+            >>> client = ClaudeClient()
+            >>> answers = client.generate_many(
+            ...     ["Define OAuth", "Define JWT", "Define PKCE"],
+            ...     max_tokens=200,
+            ... )
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        async def run() -> List[str]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            # A fresh client: SDK async clients can't be reused across event loops
+            async with self._create_async_anthropic_client() as client:
+
+                async def generate_one(prompt: str) -> str:
+                    async with semaphore:
+                        return await self._agenerate_with(client, prompt, **kwargs)
+
+                return list(await asyncio.gather(*(generate_one(p) for p in prompts)))
+
+        return asyncio.run(run())
+
+    def chat(self, messages: List[Dict[str, Any]], **kwargs: Any) -> str:
+        """
+        Generate the next assistant turn for a multi-turn conversation.
+
+        Sends the conversation as native Messages API turns rather than a
+        single concatenated prompt, so content blocks may carry
+        ``cache_control`` markers to enable server-side prompt caching.
+
+        Args:
+            messages: Conversation as a list of {"role": ..., "content": ...}
+                      dicts, alternating user/assistant and ending with user
+
+            **kwargs: Same optional overrides as generate()
+
+        Returns:
+            Generated text as string
+
+        Raises:
+            RuntimeError: If the Claude API call fails
+
+        Example:
+            >>> client = ClaudeClient()
+            >>> response = client.chat([
+            ...     {"role": "user", "content": "Hi, I'm learning Python."},
+            ...     {"role": "assistant", "content": "Great! How can I help?"},
+            ...     {"role": "user", "content": "What is a decorator?"},
+            ... ])
+        """
+        params = self._build_params(messages, **kwargs)
+
+        try:
+            response = self.client.messages.create(**params)
+            return str(response.content[0].text)
+
+        except Exception as e:
+            # Content is either a string or a list of content blocks
+            prompt_length = 0
+            for message in messages:
+                content = message["content"]
+                if isinstance(content, str):
+                    prompt_length += len(content)
+                else:
+                    prompt_length += sum(len(block.get("text", "")) for block in content)
+            raise RuntimeError(self._format_api_error(e, prompt_length, params)) from e
+
+    def stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """
+        Stream generated text from Claude API as it is produced.
+
+        Synchronous counterpart of astream(), for WSGI apps and scripts.
+
+        Args:
+            prompt: The prompt to send to Claude
+
+            **kwargs: Same optional overrides as generate()
+
+        Yields:
+            Text deltas as strings
+
+        Raises:
+            RuntimeError: If the Claude API call fails
+
+        Example:
+            >>> client = ClaudeClient()
+            >>> for delta in client.stream("Explain Python decorators"):
+            ...     print(delta, end="", flush=True)
+        """
+        params = self._build_params([{"role": "user", "content": prompt}], **kwargs)
+
+        try:
+            with self.client.messages.stream(**params) as stream:
+                yield from stream.text_stream
+
+        except Exception as e:
+            raise RuntimeError(self._format_api_error(e, len(prompt), params)) from e
+
+    async def astream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Stream generated text from Claude API as it is produced.
+
+        Uses the Messages streaming API, so the first text delta arrives as soon
+        as the model emits it instead of after the full response is complete.
+
+        Args:
+            prompt: The prompt to send to Claude
+
+            **kwargs: Same optional overrides as generate()
+
+        Yields:
+            Text deltas as strings
+
+        Raises:
+            RuntimeError: If the Claude API call fails
+
+        Example:
+            >>> client = ClaudeClient()
+            >>> async for delta in client.astream("Explain Python decorators"):
+            ...     print(delta, end="", flush=True)
+        """
+        params = self._build_params([{"role": "user", "content": prompt}], **kwargs)
+
+        client = self._get_async_client()
+
+        try:
+            async with client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        except Exception as e:
+            raise RuntimeError(self._format_api_error(e, len(prompt), params)) from e
+
+    def _format_api_error(self, e: Exception, prompt_length: int, params: Dict[str, Any]) -> str:
+        """
+        Build a helpful error message for a failed Claude API call.
+
+        Args:
+            e: The exception raised by the Anthropic SDK
+            prompt_length: Number of prompt characters that were sent
+            params: The request parameters that were used
+
+        Returns:
+            Multi-line error message with request details and fix suggestions
+        """
+        error_details = (
+            f"❌ Claude API Call Failed\n\n"
+            f"Error: {e}\n\n"
+            f"Request Details:\n"
+            f"  - Model: {params['model']}\n"
+            f"  - Prompt length: {prompt_length} characters\n"
+            f"  - Temperature: {params['temperature']}\n"
+            f"  - Max tokens: {params['max_tokens']}\n\n"
+            f"Authentication:\n"
+            f"  - Type: {self.credentials.auth_type.value}\n"
+            f"  - Source: {self.credentials.source.value}\n\n"
+        )
+
+        # Add specific help based on error type
+        error_str = str(e).lower()
+
+        if "authentication" in error_str or "api key" in error_str or "401" in error_str:
+            error_details += (
+                "Possible Causes:\n"
+                "  - Invalid or expired credentials\n"
+                "  - OAuth token expired (if using Claude Code)\n\n"
+                "How to Fix:\n"
+                "  1. Check credentials: python -m claude_oauth_auth status\n"
+                "  2. If using OAuth: Run 'claude' and log in again\n"
+                "  3. If using API key: Verify key at https://console.anthropic.com/settings/keys\n"
+            )
+        elif "rate limit" in error_str or "429" in error_str:
+            error_details += (
+                "Rate Limit Exceeded:\n"
+                "  - You've made too many requests too quickly\n\n"
+                "How to Fix:\n"
+                "  1. Wait a few minutes before retrying\n"
+                "  2. Implement exponential backoff in your code\n"
+                "  3. Consider upgrading your API tier\n"
+            )
+        elif "quota" in error_str or "insufficient" in error_str:
+            error_details += (
+                "Quota/Credit Issue:\n"
+                "  - Insufficient API credits or quota exceeded\n\n"
+                "How to Fix:\n"
+                "  1. Check your account balance: https://console.anthropic.com/\n"
+                "  2. Add credits to your account\n"
+                "  3. Or use Claude Code OAuth with Max subscription\n"
+            )
+        elif "model" in error_str or "404" in error_str:
+            error_details += (
+                "Model Issue:\n"
+                "  - Model may not exist or you don't have access\n\n"
+                "How to Fix:\n"
+                "  1. Verify model name is correct\n"
+                "  2. Check available models: https://docs.anthropic.com/models\n"
+                "  3. Ensure your account has access to this model\n"
+            )
+        elif "timeout" in error_str or "connection" in error_str:
+            error_details += (
+                "Connection Issue:\n"
+                "  - Network timeout or connection error\n\n"
+                "How to Fix:\n"
+                "  1. Check your internet connection\n"
+                "  2. Retry the request\n"
+                "  3. Check Anthropic status: https://status.anthropic.com/\n"
+            )
+        else:
+            error_details += (
+                "Troubleshooting:\n"
+                "  1. Run diagnostics: python -m claude_oauth_auth diagnose\n"
+                "  2. Check Anthropic status: https://status.anthropic.com/\n"
+                "  3. Review API docs: https://docs.anthropic.com/\n"
+                "  4. Get help: https://github.com/astoreyai/claude-oauth-auth/issues\n"
+            )
+
+        return error_details
 
     def get_auth_info(self) -> Dict[str, Any]:
         """
@@ -372,6 +725,24 @@ class ClaudeClient:
             "max_tokens": self.max_tokens,
         }
 
+    def reset_connections(self) -> None:
+        """
+        Recreate the HTTP and SDK clients, keeping the discovered credentials.
+
+        Call this in a forked child process (e.g. a gunicorn post_fork hook)
+        so the worker does not share pooled sockets with its parent. The
+        inherited pool is dropped without closing it, since closing would
+        also shut connections the parent still owns. The new clients replace
+        the shared ones, so ClaudeClients created afterwards use them too.
+
+        Example:
+            >>> def post_fork(server, worker):
+            ...     claude_client.reset_connections()
+        """
+        self.http_client, self.client = self._get_shared_client(replace=True)
+        with self._async_clients_lock:
+            self._async_clients = weakref.WeakKeyDictionary()
+
     def get_full_auth_status(self) -> Dict[str, Any]:
         """
         Get comprehensive authentication status including available methods.
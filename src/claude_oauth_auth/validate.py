@@ -19,7 +19,7 @@ Usage:
 import logging
 import re
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from .oauth_manager import OAuthTokenManager
 
@@ -170,6 +170,15 @@ def validate_refresh_token(token: str) -> Tuple[bool, str]:
     return True, "Refresh token format is valid"
 
 
+# Credential prefix (always 13 characters) -> (format validator, credential type);
+# one slice and dict lookup pick the validator before any regex runs
+_CREDENTIAL_PREFIX_LENGTH = 13
+_CREDENTIAL_VALIDATORS: Dict[str, Tuple[Callable[[str], Tuple[bool, str]], str]] = {
+    "sk-ant-api03-": (validate_api_key, "api_key"),
+    "sk-ant-oat01-": (validate_oauth_token, "oauth_token"),
+}
+
+
 def is_token_expired(
     token_manager: Optional[OAuthTokenManager] = None,
     credentials_path: Optional[str] = None
@@ -261,15 +270,12 @@ def validate_credential(credential: str) -> Tuple[bool, str, Optional[str]]:
     if not isinstance(credential, str):
         return False, f"Credential must be a string, got {type(credential).__name__}", None
 
-    # Check if it's an API key
-    if credential.startswith("sk-ant-api03-"):
-        is_valid, message = validate_api_key(credential)
-        return is_valid, message, "api_key" if is_valid else None
-
-    # Check if it's an OAuth token
-    if credential.startswith("sk-ant-oat01-"):
-        is_valid, message = validate_oauth_token(credential)
-        return is_valid, message, "oauth_token" if is_valid else None
+    # Dispatch on the prefix: API key or OAuth token
+    validator = _CREDENTIAL_VALIDATORS.get(credential[:_CREDENTIAL_PREFIX_LENGTH])
+    if validator is not None:
+        validate, credential_type = validator
+        is_valid, message = validate(credential)
+        return is_valid, message, credential_type if is_valid else None
 
     # Unknown credential type
     return False, (
@@ -313,7 +319,10 @@ def get_validation_hints(credential: str) -> str:
             "Use just: 'sk-ant-...'"
         )
 
-    if credential.startswith("sk-ant-") and not credential.startswith(("sk-ant-api03-", "sk-ant-oat01-")):
+    if (
+        credential.startswith("sk-ant-")
+        and credential[:_CREDENTIAL_PREFIX_LENGTH] not in _CREDENTIAL_VALIDATORS
+    ):
         hints.append(
             f"Unknown Anthropic credential prefix: {credential[:15]}... "
             f"Valid prefixes: 'sk-ant-api03-' (API key) or 'sk-ant-oat01-' (OAuth token)"